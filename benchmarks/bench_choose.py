@@ -0,0 +1,44 @@
+"""Cost of argument isolation modes of `choose_ok` on large nested dict.
+
+Run with::
+
+        python -m benchmarks.bench_choose
+"""
+
+import timeit
+
+from fundom.result import choose_ok
+
+
+def fail(_: dict) -> Exception:
+    return Exception()
+
+
+def succeed(payload: dict) -> int:
+    return len(payload)
+
+
+def payload(size: int = 1_000) -> dict:
+    return {
+        f"key_{idx}": {"values": list(range(10)), "meta": {"idx": idx}}
+        for idx in range(size)
+    }
+
+
+def main(number: int = 100) -> None:
+    data = payload()
+    frozen = tuple(range(10_000))
+
+    for mode, arg in [
+        ("deepcopy", data),
+        ("copy", data),
+        ("none", data),
+        ("immutable", frozen),
+    ]:
+        chooser = choose_ok(mode) | fail | fail | succeed
+        elapsed = timeit.timeit(lambda: chooser(arg), number=number)  # noqa: B023
+        print(f"{mode:<20}{elapsed / number * 1e6:>10.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
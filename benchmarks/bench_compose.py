@@ -0,0 +1,43 @@
+"""Per-call overhead of `compose` compared to hand-written nested call.
+
+Run with::
+
+        python -m benchmarks.bench_compose
+"""
+
+import timeit
+
+from fundom.core import compose
+
+
+def add_1(x: int) -> int:
+    return x + 1
+
+
+def mul_2(x: int) -> int:
+    return x * 2
+
+
+def sub_3(x: int) -> int:
+    return x - 3
+
+
+def nested(x: int) -> int:
+    return sub_3(mul_2(add_1(x)))
+
+
+def main(number: int = 1_000_000) -> None:
+    composition = compose() << add_1 << mul_2 << sub_3
+    compiled = composition.compile()
+
+    for name, func in [
+        ("hand-written", nested),
+        ("compose", composition),
+        ("compose.compile", compiled),
+    ]:
+        elapsed = timeit.timeit(lambda: func(1), number=number)  # noqa: B023
+        print(f"{name:<20}{elapsed / number * 1e9:>10.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Per-call overhead of curried functions built with `hof*`.
+
+Compares closure-based currying (previous implementation of `hof2`) with current
+`partial`-based `hof2` and `hofn`.
+
+Run with::
+
+        python -m benchmarks.bench_hof
+"""
+
+import timeit
+from functools import wraps
+
+from fundom.core import hof2, hofn
+
+
+def closure_hof2(f):
+    @wraps(f)
+    def _wrapper(arg_1, arg_2):
+        def _func(*args, **kwargs):
+            return f(arg_1, arg_2, *args, **kwargs)
+
+        return _func
+
+    return _wrapper
+
+
+def replace(old: str, new: str, arg: str) -> str:
+    return arg.replace(old, new)
+
+
+def main(number: int = 1_000_000) -> None:
+    for name, curried in [
+        ("direct call", None),
+        ("closure hof2", closure_hof2(replace)("a", "b")),
+        ("hof2", hof2(replace)("a", "b")),
+        ("hofn(2)", hofn(2)(replace)("a", "b")),
+    ]:
+        if curried is None:
+            elapsed = timeit.timeit(lambda: replace("a", "b", "abc"), number=number)
+        else:
+            elapsed = timeit.timeit(lambda: curried("abc"), number=number)  # noqa: B023
+        print(f"{name:<20}{elapsed / number * 1e9:>10.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Per-call overhead of `pipe` compared to `pipe.run`.
+
+Run with::
+
+        python -m benchmarks.bench_pipe
+"""
+
+import timeit
+
+from fundom.core import pipe
+
+
+def add_1(x: int) -> int:
+    return x + 1
+
+
+def mul_2(x: int) -> int:
+    return x * 2
+
+
+def sub_3(x: int) -> int:
+    return x - 3
+
+
+def with_pipe() -> int:
+    return (pipe(1) << add_1 << mul_2 << sub_3).finish()
+
+
+def with_pipe_run() -> int:
+    return pipe.run(1, add_1, mul_2, sub_3)
+
+
+def hand_written() -> int:
+    return sub_3(mul_2(add_1(1)))
+
+
+def main(number: int = 1_000_000) -> None:
+    for name, func in [
+        ("hand-written", hand_written),
+        ("pipe", with_pipe),
+        ("pipe.run", with_pipe_run),
+    ]:
+        elapsed = timeit.timeit(func, number=number)
+        print(f"{name:<20}{elapsed / number * 1e9:>10.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
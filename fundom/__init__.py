@@ -1,16 +1,32 @@
 from .core import (
     cfilter,
+    cfilter_future,
     cmap,
+    cmap_future,
+    cmap_parallel,
     compose,
+    fold_assoc,
     foldl,
     foldr,
+    foldr_lazy,
     future,
     hof1,
     hof2,
     hof3,
+    hofn,
+    in_process,
+    in_thread,
+    isolation,
+    isolation_split,
     pipe,
+    railway_compose,
+    railway_handler,
+    railway_pipe,
+    reduced,
     returns,
     returns_future,
+    set_executor,
     this,
     this_future,
+    with_batch,
 )
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from functools import reduce, wraps
+import asyncio
+import copy
+import os
+import pickle  # noqa: S403
+import tempfile
+from concurrent import futures
+from contextlib import contextmanager
+from dataclasses import dataclass, fields, is_dataclass
+from enum import Enum
+from functools import partial, reduce, update_wrapper, wraps
+from itertools import islice, repeat
 from typing import (
     Any,
+    AsyncIterator,
     Awaitable,
     Callable,
     Concatenate,
@@ -11,10 +21,15 @@ from typing import (
     Generator,
     Generic,
     Iterable,
+    Iterator,
+    Literal,
     ParamSpec,
+    Sequence,
     TypeVar,
 )
 
+from fundom import tracing
+
 T = TypeVar("T")
 V = TypeVar("V")
 U = TypeVar("U")
@@ -25,6 +40,9 @@ P = ParamSpec("P")
 class future(Generic[T]):  # noqa
     """Abstraction over awaitable value to run in pipeline.
 
+    Sync functions passed with `<<` are collected into `stages` and run one by one
+    in a single coroutine once wrapped value is awaited.
+
     Example::
 
             result = await (
@@ -36,21 +54,38 @@ class future(Generic[T]):  # noqa
     """
 
     value: Awaitable[T]
+    stages: tuple[Callable, ...] = ()
 
     def __await__(self) -> Generator[None, None, T]:
-        return self.value.__await__()
+        if len(self.stages) == 0:
+            return self.value.__await__()
+
+        return self.__then().__await__()
+
+    async def __then(self) -> T:
+        result = await self.value
+
+        if tracing.current is not None or tracing.blocking is not None:
+            for func in self.stages:
+                result = tracing.run_stage(func, (result,), self.stages)
+            return result
+
+        for func in self.stages:
+            result = func(result)
 
-    async def __then(self, func: Callable[[T], V]) -> V:
-        return func(await self.value)
+        return result
 
     async def __then_async(self, func: Callable[[T], Awaitable[V]]) -> V:
-        return await func(await self.value)
+        if tracing.current is not None:
+            return await tracing.current.call_async(func, await self)
+
+        return await func(await self)
 
     def __rshift__(self, func: Callable[[T], Awaitable[V]]) -> future[V]:
         return future(self.__then_async(func))
 
     def __lshift__(self, func: Callable[[T], V]) -> future[V]:
-        return future(self.__then(func))
+        return future(self.value, (*self.stages, func))
 
     @staticmethod
     def returns(func: Callable[P, Coroutine[Any, Any, T]]):
@@ -93,9 +128,15 @@ class pipe(Generic[T]):  # noqa
     value: T
 
     def __lshift__(self, func: Callable[[T], V]) -> pipe[V]:
+        if tracing.current is not None:
+            return pipe(tracing.current.call(func, self.value))
+
         return pipe(func(self.value))
 
     def __rshift__(self, func: Callable[[T], Awaitable[V]]) -> future[V]:
+        if tracing.current is not None:
+            return future(tracing.current.call_async(func, self.value))
+
         return future(func(self.value))
 
     def finish(self) -> T:
@@ -115,6 +156,35 @@ class pipe(Generic[T]):  # noqa
         """
         return self.value
 
+    @staticmethod
+    def run(value: Any, *funcs: Callable[[Any], Any]) -> Any:
+        """Pass `value` through `funcs` without allocating `pipe` on each step.
+
+        Equivalent to `(pipe(value) << funcs[0] << funcs[1] ...).finish()`.
+
+        Example::
+
+                result: int = pipe.run(
+                    12,
+                    (lambda x: x + 1),
+                    (lambda x: x**2),
+                    (lambda x: x // 3),
+                )
+
+        Returns:
+            Any: result of the last function.
+        """
+        if tracing.current is not None:
+            tracer = tracing.current
+            for func in funcs:
+                value = tracer.call(func, value)
+            return value
+
+        for func in funcs:
+            value = func(value)
+
+        return value
+
     @staticmethod
     def returns(func: Callable[P, pipe[T]]) -> Callable[P, T]:
         """Decorator for functions that return `pipe` object for seamless unwrapping.
@@ -196,71 +266,49 @@ def returns_future(x: T) -> Callable[P, future[T]]:
 @dataclass(slots=True, init=False)
 class _compose_future(Generic[P, V]):  # noqa
 
-    funcs: list
-    first_async: bool | None
-    last_async: bool | None
+    stages: list[tuple[Callable, bool]]
 
     def __init__(self) -> None:
-        self.funcs = []
-        self.first_async = None
-        self.last_async = None
+        self.stages = []
 
     def __call__(self, *args: P.args, **_: P.kwargs) -> future[V]:  # noqa
-        if len(self.funcs) == 0:
+        if len(self.stages) == 0:
             raise Exception("Empty function composition.")
 
-        if self.first_async:
-            current_async = True
-            result = future(self.funcs[0][0](*args))
-            for f in self.funcs[0][1:]:
-                result = result >> f
-        else:
-            current_async = False
-            result = pipe(self.funcs[0][0](*args))
-            for f in self.funcs[0][1:]:
-                result = result << f
+        return future(self.__run(args))
+
+    async def __run(self, args: tuple) -> V:
+        if tracing.current is not None or tracing.blocking is not None:
+            return await self.__run_traced(args)
 
-        current_async = not current_async
+        stages = iter(self.stages)
 
-        for g in self.funcs[1:]:
-            for f in g:
-                if current_async:
-                    result = result >> f
-                else:
-                    result = result << f
+        func, is_async = next(stages)
+        result = await func(*args) if is_async else func(*args)
 
-            current_async = not current_async
+        for func, is_async in stages:
+            result = await func(result) if is_async else func(result)
 
         return result
 
-    def __lshift__(self, nxt: Callable[[V], U]) -> _compose_future[P, U]:
-        if self.first_async is None:
-            self.first_async = False
-            self.last_async = False
-            self.funcs.append([nxt])
-            return self
+    async def __run_traced(self, args: tuple) -> V:
+        pipeline = [func for func, _ in self.stages]
 
-        if self.last_async:
-            self.funcs.append([nxt])
-            self.last_async = False
-        else:
-            self.funcs[-1].append(nxt)
+        for func, is_async in self.stages:
+            if is_async:
+                result = await tracing.await_stage(func, args)
+            else:
+                result = tracing.run_stage(func, args, pipeline)
+            args = (result,)
 
+        return result
+
+    def __lshift__(self, nxt: Callable[[V], U]) -> _compose_future[P, U]:
+        self.stages.append((nxt, False))
         return self
 
     def __rshift__(self, nxt: Callable[[V], Awaitable[U]]) -> _compose_future[P, U]:
-        if self.first_async is None:
-            self.first_async = True
-            self.last_async = True
-            self.funcs.append([nxt])
-            return self
-
-        if self.last_async:
-            self.funcs[-1].append(nxt)
-        else:
-            self.last_async = True
-            self.funcs.append([nxt])
-
+        self.stages.append((nxt, True))
         return self
 
 
@@ -288,13 +336,101 @@ class compose(Generic[P, V]):  # noqa
         if len(self.funcs) == 0:
             raise Exception("Empty function composition.")
 
-        result = self.funcs[0](*args)
+        if tracing.current is not None:
+            return self.__call_traced(args, tracing.current)
 
-        for func in self.funcs[1:]:
+        funcs = iter(self.funcs)
+        result = next(funcs)(*args)
+
+        for func in funcs:
             result = func(result)
 
         return result
 
+    def __call_traced(self, args: tuple, tracer: tracing.Tracer) -> V:
+        funcs = iter(self.funcs)
+        result = tracer.call(next(funcs), *args)
+
+        for func in funcs:
+            result = tracer.call(func, result)
+
+        return result
+
+    def compile(self) -> Callable[P, V]:  # noqa: A003
+        """Build single flat function out of composition.
+
+        Stages are bound as locals of generated function, so there is no loop over
+        stages on call, only packing of arguments into `*args` remains compared to
+        hand-written nested call. Functions added to composition after `compile` are
+        not included in result. Stages are traced if tracing is enabled when compiled
+        function is called.
+
+        Example::
+
+                f: Callable[[int], int] = (
+                    compose()
+                    << (lambda x: x + 1)
+                    << (lambda x: x ** 2)
+                ).compile()
+
+        Returns:
+            Callable[P, V]: compiled composition.
+        """
+        if len(self.funcs) == 0:
+            raise Exception("Empty function composition.")
+
+        # traced calls fall back to composition with the same stages
+        snapshot = compose()
+        snapshot.funcs = list(self.funcs)
+
+        names = [f"_f{idx}" for idx in range(len(snapshot.funcs))]
+        lines = [
+            f"def _factory(_tracing, _traced, {', '.join(names)}):",
+            "    def _compiled(*args):",
+            "        if _tracing.current is not None:",
+            "            return _traced(*args)",
+            f"        result = {names[0]}(*args)",
+        ]
+        lines.extend(f"        result = {name}(result)" for name in names[1:])
+        lines.extend(["        return result", "    return _compiled"])
+
+        source = "\n".join(lines)
+        namespace: dict[str, Any] = {}
+        exec(source, namespace)  # noqa: S102
+        return namespace["_factory"](tracing, snapshot, *snapshot.funcs)
+
+    def map_batch(self, items: Iterable[Any]) -> Sequence[V]:
+        """Run composition over batch of single-argument inputs stage by stage.
+
+        Each stage processes the whole batch before the next one starts. Stages with
+        batch variant attached via `with_batch` are called once per batch, others are
+        called for every item.
+
+        Example::
+
+                f = compose() << parse << with_batch(np.sqrt)(math.sqrt)
+                results = f.map_batch(records)
+
+        Args:
+            items (Iterable[Any]): inputs for composition.
+
+        Returns:
+            Sequence[V]: results in order of `items`.
+        """
+        if len(self.funcs) == 0:
+            raise Exception("Empty function composition.")
+
+        batch: Sequence = list(items)
+
+        for func in self.funcs:
+            match func:
+                case _batched():
+                    batch = func.batch(batch)
+                case _:
+                    batch = [func(item) for item in batch]
+
+        return batch
+
     def __lshift__(self, nxt: Callable[[V], U]) -> compose[P, U]:
         self.funcs.append(nxt)
         return self
@@ -307,6 +443,308 @@ class compose(Generic[P, V]):  # noqa
         return cf >> nxt
 
 
+class _marker(Generic[P, V]):  # noqa
+    """Base of callables that mark wrapped function for special handling.
+
+    Calls are forwarded to wrapped function and its metadata is copied, so function
+    itself is not modified. Markers are detected by type, so they do not leak to
+    wrappers created with `functools.wraps`.
+    """
+
+    def __init__(self, func: Callable[P, V]) -> None:
+        update_wrapper(self, func)
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> V:
+        return self.__wrapped__(*args, **kwargs)
+
+
+class _batched(_marker[[T], V]):  # noqa
+    """Function with batch variant attached by `with_batch`."""
+
+    def __init__(
+        self, func: Callable[[T], V], batch: Callable[[Sequence[T]], Sequence[V]]
+    ) -> None:
+        super().__init__(func)
+        self.batch = batch
+
+
+def with_batch(batch_func: Callable[[Sequence[T]], Sequence[V]]):
+    """Attach batch variant to function to be used by `compose.map_batch`.
+
+    Batch variant receives whole batch and must return results in the same order.
+    It is used only when decorated function is passed to composition directly,
+    wrappers like `safe` or `if_ok` around it are called for every item.
+
+    Example::
+
+            @with_batch(np.sqrt)
+            def sqrt(x: float) -> float:
+                return math.sqrt(x)
+    """
+
+    def _decorator(func: Callable[[T], V]) -> Callable[[T], V]:
+        return _batched(func, batch_func)
+
+    return _decorator
+
+
+# railway utils
+
+Track = Literal["error", "none"]
+
+
+def railway_handler(track: Track):
+    """Mark function as handler of failed values in railway pipelines.
+
+    `"error"` handlers are called on `Exception` values and `"none"` handlers on
+    `None`, other functions are called only on successful values.
+
+    Example::
+
+            @railway_handler("error")
+            def log_error(err: Exception) -> Exception:
+                logger.error(err)
+                return err
+    """
+
+    def _decorator(func: Callable[P, V]) -> Callable[P, V]:
+        return _railway(func, track)
+
+    return _decorator
+
+
+class _railway(_marker[P, V]):  # noqa
+    """Function marked as failed values handler by `railway_handler`."""
+
+    def __init__(self, func: Callable[P, V], track: Track) -> None:
+        super().__init__(func)
+        self.track = track
+
+
+def _track_of_stage(func: Callable) -> Track | None:
+    while isinstance(func, partial):
+        func = func.func
+
+    return func.track if isinstance(func, _railway) else None
+
+
+def _track_of_value(value: Any) -> Track | None:
+    match value:
+        case None:
+            return "none"
+        case Exception():
+            return "error"
+        case _:
+            return None
+
+
+@dataclass(slots=True, frozen=True)
+class railway_pipe(Generic[T]):  # noqa
+    """`pipe` that jumps over stages that do not handle current value.
+
+    Once value becomes `Exception` or `None` only stages marked with
+    `railway_handler` for that kind of value (like `if_error`, `if_error_returns`,
+    `if_none` and `if_none_returns`) are called, others are skipped. Handlers are
+    skipped for successful values.
+
+    Example::
+
+            result = (
+                railway_pipe({"body": b"hello", "status": 200})
+                << safe(lambda dct: dct["Hello"])
+                << if_ok(bytes_decode("UTF-8"))  # not called
+                << if_ok(str_split(","))  # not called
+                << if_error(lambda err: str(err))
+            ).finish()
+    """
+
+    value: T
+
+    def __lshift__(self, func: Callable[[T], V]) -> railway_pipe[V]:
+        if _track_of_value(self.value) != _track_of_stage(func):
+            return self
+
+        if tracing.current is not None:
+            return railway_pipe(tracing.current.call(func, self.value))
+
+        return railway_pipe(func(self.value))
+
+    def finish(self) -> T:
+        """Finish `railway_pipe` by unpacking internal value.
+
+        Returns:
+            T: internal value
+        """
+        return self.value
+
+
+@dataclass(slots=True, init=False)
+class railway_compose(Generic[P, V]):  # noqa
+    """`compose` that jumps over stages that do not handle current value.
+
+    Stages are selected the same way as in `railway_pipe`, the first stage is always
+    called.
+
+    Example::
+
+            f: Callable[[bytes], dict | None] = (
+                railway_compose()
+                << some_when(is_not_empty)
+                << if_some(bytes_decode("UTF-8"))
+                << if_some(json.loads)
+                << if_none_returns({})
+            )
+    """
+
+    stages: list[tuple[Callable, Track | None]]
+
+    def __init__(self) -> None:
+        self.stages = []
+
+    def __call__(self, *args: P.args, **_: P.kwargs) -> V:  # noqa
+        if len(self.stages) == 0:
+            raise Exception("Empty function composition.")
+
+        if tracing.current is not None:
+            return self.__call_traced(args, tracing.current)
+
+        stages = iter(self.stages)
+        func, _ = next(stages)
+        result = func(*args)
+
+        for func, track in stages:
+            if _track_of_value(result) == track:
+                result = func(result)
+
+        return result
+
+    def __call_traced(self, args: tuple, tracer: tracing.Tracer) -> V:
+        stages = iter(self.stages)
+        func, _ = next(stages)
+        result = tracer.call(func, *args)
+
+        for func, track in stages:
+            if _track_of_value(result) == track:
+                result = tracer.call(func, result)
+
+        return result
+
+    def __lshift__(self, nxt: Callable[[V], U]) -> railway_compose[P, U]:
+        self.stages.append((nxt, _track_of_stage(nxt)))
+        return self
+
+
+# argument isolation utils
+
+Isolation = Literal["deepcopy", "copy", "none", "immutable"]
+
+_IMMUTABLE_SCALARS = frozenset(
+    {int, float, complex, str, bytes, bool, range, type(None)}
+)
+
+
+def _check_immutable(arg: Any) -> None:
+    if type(arg) in _IMMUTABLE_SCALARS:
+        return
+
+    if isinstance(arg, (*_IMMUTABLE_SCALARS, Enum)):
+        return
+
+    if isinstance(arg, (tuple, frozenset)):
+        for item in arg:
+            if type(item) not in _IMMUTABLE_SCALARS:
+                _check_immutable(item)
+    elif (
+        is_dataclass(arg)
+        and not isinstance(arg, type)
+        and arg.__dataclass_params__.frozen
+    ):
+        for fld in fields(arg):
+            _check_immutable(getattr(arg, fld.name))
+    else:
+        raise TypeError(f"{type(arg).__name__} is not immutable.")
+
+
+def _isolate_deepcopy(args: tuple) -> tuple:
+    return copy.deepcopy(args)
+
+
+def _isolate_copy(args: tuple) -> tuple:
+    return tuple(copy.copy(arg) for arg in args)
+
+
+def _isolate_none(args: tuple) -> tuple:
+    return args
+
+
+def _isolate_immutable(args: tuple) -> tuple:
+    _check_immutable(args)
+    return args
+
+
+def isolation(mode: Isolation) -> Callable[[tuple], tuple]:
+    """Get function that protects arguments from being modified by callee.
+
+    Modes:
+        - `"deepcopy"` - deep copy of arguments.
+        - `"copy"` - shallow copy of every argument.
+        - `"none"` - arguments are passed as is, for pure functions.
+        - `"immutable"` - arguments are passed as is, but `TypeError` is raised if
+          any of them is not immutable.
+
+    Example::
+
+            isolate = isolation("copy")
+            func(*isolate(args))
+
+    Args:
+        mode (Isolation): isolation mode.
+
+    Returns:
+        Callable[[tuple], tuple]: arguments isolation function.
+    """
+    match mode:
+        case "deepcopy":
+            return _isolate_deepcopy
+        case "copy":
+            return _isolate_copy
+        case "none":
+            return _isolate_none
+        case "immutable":
+            return _isolate_immutable
+        case _:
+            raise ValueError(f"Unknown isolation mode: {mode}.")
+
+
+def isolation_split(
+    mode: Isolation,
+) -> tuple[Callable[[tuple], tuple], Callable[[tuple], tuple]]:
+    """Split `isolation` into part run once per call and part run once per callee.
+
+    Used when the same arguments are passed to several callees: copies are made for
+    every callee while `"immutable"` check is done only once.
+
+    Example::
+
+            check, isolate = isolation_split("immutable")
+            args = check(args)
+            for func in funcs:
+                func(*isolate(args))
+
+    Args:
+        mode (Isolation): isolation mode.
+
+    Returns:
+        tuple[Callable[[tuple], tuple], Callable[[tuple], tuple]]: per call and per
+            callee isolation functions.
+    """
+    match mode:
+        case "immutable":
+            return _isolate_immutable, _isolate_none
+        case _:
+            return _isolate_none, isolation(mode)
+
+
 # curring utils
 
 A1 = TypeVar("A1")
@@ -320,10 +758,7 @@ def hof1(f: Callable[Concatenate[A1, P], AResult]):
 
     @wraps(f)
     def _wrapper(arg_1: A1) -> Callable[P, AResult]:
-        def _func(*args: P.args, **kwargs: P.kwargs) -> AResult:
-            return f(arg_1, *args, **kwargs)
-
-        return _func
+        return partial(f, arg_1)
 
     return _wrapper
 
@@ -333,10 +768,7 @@ def hof2(f: Callable[Concatenate[A1, A2, P], AResult]):
 
     @wraps(f)
     def _wrapper(arg_1: A1, arg_2: A2) -> Callable[P, AResult]:
-        def _func(*args: P.args, **kwargs: P.kwargs) -> AResult:
-            return f(arg_1, arg_2, *args, **kwargs)
-
-        return _func
+        return partial(f, arg_1, arg_2)
 
     return _wrapper
 
@@ -346,18 +778,69 @@ def hof3(f: Callable[Concatenate[A1, A2, A3, P], AResult]):
 
     @wraps(f)
     def _wrapper(arg_1: A1, arg_2: A2, arg_3: A3) -> Callable[P, AResult]:
-        def _func(*args: P.args, **kwargs: P.kwargs) -> AResult:
-            return f(arg_1, arg_2, arg_3, *args, **kwargs)
-
-        return _func
+        return partial(f, arg_1, arg_2, arg_3)
 
     return _wrapper
 
 
+@dataclass(slots=True, frozen=True)
+class reduced(Generic[T]):  # noqa
+    """Aggregation value that stops `foldl` or `foldr` immediately.
+
+    Example::
+
+            # 6, stops on 4th element
+            foldl(lambda acc, x: reduced(acc) if x > 3 else acc + x, 0)(
+                itertools.count(1)
+            )
+    """
+
+    value: T
+
+
+def _fold(folder: Callable[[A1, A2], A1], initial: A1, lst: Iterable[A2]) -> A1:
+    acc = initial
+    for item in lst:
+        acc = folder(acc, item)
+        if type(acc) is reduced:
+            return acc.value
+
+    return acc
+
+
+def hofn(count: int):
+    """Separate first `count` arguments from other.
+
+    Generic version of `hof1`, `hof2` and `hof3`. Wrapper accepts exactly `count`
+    positional arguments and returns `functools.partial`, so calling result adds no
+    Python frames.
+
+    Example::
+
+            @hofn(4)
+            def clamp_and_scale(lower, upper, scale, shift, value):
+                ...
+
+            clamp_and_scale(0, 10, 2, 1)(5)
+    """
+    names = ", ".join(f"arg_{idx}" for idx in range(1, count + 1))
+    source = f"def _wrapper({names}):\n    return partial(f, {names})"
+
+    def _decorator(f: Callable[..., AResult]) -> Callable[..., Callable[..., AResult]]:
+        namespace = {"partial": partial, "f": f}
+        exec(source, namespace)  # noqa: S102
+        return wraps(f)(namespace["_wrapper"])
+
+    return _decorator
+
+
 @hof2
 def foldl(folder: Callable[[A1, A2], A1], initial: A1, lst: Iterable[A2]) -> A1:
     """Curried `reduce` left function.
 
+    `folder` can return `reduced` value to stop folding, the rest of `lst` is not
+    read in that case.
+
     Args:
         folder (Callable[[A1, A2], A1]): aggregator.
         initial (A1): initial aggregation value.
@@ -366,13 +849,46 @@ def foldl(folder: Callable[[A1, A2], A1], initial: A1, lst: Iterable[A2]) -> A1:
     Returns:
         A1: reduction result.
     """
-    return reduce(folder, lst, initial)
+    return _fold(folder, initial, lst)
+
+
+_SPILL_CHUNK_SIZE = 65_536
+
+
+def _reversed_spilled(items: Iterator[A1]) -> Iterator[A1]:
+    chunk = list(islice(items, _SPILL_CHUNK_SIZE))
+    if len(chunk) < _SPILL_CHUNK_SIZE:
+        yield from reversed(chunk)
+        return
+
+    with tempfile.TemporaryFile() as file:
+        offsets = []
+        while chunk:
+            offsets.append(file.tell())
+            pickle.dump(chunk, file)
+            chunk = list(islice(items, _SPILL_CHUNK_SIZE))
+
+        for offset in reversed(offsets):
+            file.seek(offset)
+            yield from reversed(pickle.load(file))  # noqa: S301
+
+
+def _reversed(lst: Iterable[A1]) -> Iterator[A1]:
+    try:
+        return reversed(lst)
+    except TypeError:
+        return _reversed_spilled(iter(lst))
 
 
 @hof2
 def foldr(folder: Callable[[A1, A2], A2], initial: A2, lst: Iterable[A1]) -> A2:
     """Curried `reduce` right function.
 
+    Sequences are traversed with `reversed` without copying. Other iterables are
+    read in chunks and, if they do not fit into one chunk, spilled to temporary file,
+    so their elements must be picklable. `folder` can return `reduced` value to stop
+    folding.
+
     Args:
         folder (Callable[[A1, A2], A2]): aggregator.
         initial (A2): initial aggregation value.
@@ -381,7 +897,43 @@ def foldr(folder: Callable[[A1, A2], A2], initial: A2, lst: Iterable[A1]) -> A2:
     Returns:
         A2: reduction result.
     """
-    return reduce(lambda x, y: folder(y, x), lst[::-1], initial)
+    return _fold(lambda x, y: folder(y, x), initial, _reversed(lst))
+
+
+@hof2
+def foldr_lazy(
+    folder: Callable[[A1, Callable[[], A2]], A2], initial: A2, lst: Iterable[A1]
+) -> A2:
+    """Curried lazy `reduce` right function.
+
+    `folder` receives function that computes aggregation of the rest of elements
+    instead of aggregation value itself, so folding stops as soon as `folder` does
+    not call it. Elements are read from `lst` only when needed, that works for
+    infinite iterables. Accumulator function must be called at most once, each call
+    adds nested frame.
+
+    Example::
+
+            # True, stops on 4th element
+            foldr_lazy(lambda x, rest: x > 3 or rest(), False)(itertools.count())
+
+    Args:
+        folder (Callable[[A1, Callable[[], A2]], A2]): aggregator.
+        initial (A2): aggregation value for the end of `lst`.
+        lst (Iterable[A1]): data to reduce.
+
+    Returns:
+        A2: reduction result.
+    """
+    items = iter(lst)
+
+    def _rest() -> A2:
+        for item in items:
+            return folder(item, _rest)
+
+        return initial
+
+    return _rest()
 
 
 @hof1
@@ -410,3 +962,381 @@ def cfilter(predicate: Callable[[A1], bool], lst: Iterable[A1]) -> Iterable[A1]:
         Iterable[A1]: filtered iterable.
     """
     return filter(predicate, lst)
+
+
+async def _run_limited(
+    func: Callable[[A1], Awaitable[A2]], lst: Iterable[A1], limit: int | None
+) -> AsyncIterator[tuple[int, A1, A2]]:
+    """Run `func` over `lst` in `limit` workers, yield results as they are ready."""
+    items: Iterator[tuple[int, A1]] = enumerate(lst)
+    if limit is None:
+        pending = list(items)
+        limit, items = max(len(pending), 1), iter(pending)
+
+    # workers pull items lazily, so at most `limit` items are read ahead of consumer
+    queue: asyncio.Queue = asyncio.Queue(maxsize=limit)
+
+    async def _worker() -> None:
+        error: Exception | None = None
+        try:
+            for idx, item in items:
+                await queue.put((idx, item, await func(item)))
+        except Exception as err:
+            error = err
+
+        await queue.put(error)
+
+    workers = [asyncio.ensure_future(_worker()) for _ in range(limit)]
+    try:
+        running = len(workers)
+        while running > 0:
+            match await queue.get():
+                case tuple() as result:
+                    yield result
+                case Exception() as err:
+                    raise err
+                case None:
+                    running -= 1
+    finally:
+        for worker in workers:
+            worker.cancel()
+
+
+async def _gather_limited(
+    func: Callable[[A1], Awaitable[A2]], lst: Iterable[A1], limit: int | None
+) -> list[tuple[A1, A2]]:
+    results: dict[int, tuple[A1, A2]] = {}
+    async for idx, item, result in _run_limited(func, lst, limit):
+        results[idx] = item, result
+
+    return [results[idx] for idx in range(len(results))]
+
+
+def cmap_future(
+    mapper: Callable[[A1], Awaitable[A2]],
+    limit: int | None = None,
+    ordered: bool = True,
+) -> Callable[[Iterable[A1]], future[list[A2]] | AsyncIterator[A2]]:
+    """Curried `map` function for async `mapper` with bounded concurrency.
+
+    Up to `limit` coroutines run concurrently, unlimited if `limit` is `None`. Items
+    are read from iterable only when there is free slot, so with `limit` set
+    iterable can be large or infinite. With `ordered=False` async iterator over
+    results in order of completion is returned instead of `future`.
+
+    Example::
+
+            users = await (
+                pipe(user_ids)
+                >> cmap_future(get_user_async, limit=10)
+                << cfilter(lambda user: user.is_active)
+            )
+
+    Args:
+        mapper (Callable[[A1], Awaitable[A2]]): async mapper for element of iterable.
+        limit (int | None): max number of concurrently running coroutines.
+        ordered (bool): keep order of results.
+
+    Returns:
+        Callable[[Iterable[A1]], future[list[A2]] | AsyncIterator[A2]]: curried
+            async map.
+    """
+
+    @future.returns
+    async def _ordered(lst: Iterable[A1]) -> list[A2]:
+        return [result for _, result in await _gather_limited(mapper, lst, limit)]
+
+    async def _unordered(lst: Iterable[A1]) -> AsyncIterator[A2]:
+        async for _, _, result in _run_limited(mapper, lst, limit):
+            yield result
+
+    return _ordered if ordered else _unordered
+
+
+def cfilter_future(
+    predicate: Callable[[A1], Awaitable[bool]],
+    limit: int | None = None,
+    ordered: bool = True,
+) -> Callable[[Iterable[A1]], future[list[A1]] | AsyncIterator[A1]]:
+    """Curried `filter` function for async `predicate` with bounded concurrency.
+
+    Up to `limit` coroutines run concurrently, unlimited if `limit` is `None`. Items
+    are read from iterable only when there is free slot, so with `limit` set
+    iterable can be large or infinite. With `ordered=False` async iterator over
+    passed items in order of completion is returned instead of `future`.
+
+    Example::
+
+            users = await (
+                pipe(users)
+                >> cfilter_future(has_permission_async, limit=10)
+            )
+
+    Args:
+        predicate (Callable[[A1], Awaitable[bool]]): to filter with.
+        limit (int | None): max number of concurrently running coroutines.
+        ordered (bool): keep order of items.
+
+    Returns:
+        Callable[[Iterable[A1]], future[list[A1]] | AsyncIterator[A1]]: curried
+            async filter.
+    """
+
+    @future.returns
+    async def _ordered(lst: Iterable[A1]) -> list[A1]:
+        return [
+            item for item, keep in await _gather_limited(predicate, lst, limit) if keep
+        ]
+
+    async def _unordered(lst: Iterable[A1]) -> AsyncIterator[A1]:
+        async for _, item, keep in _run_limited(predicate, lst, limit):
+            if keep:
+                yield item
+
+    return _ordered if ordered else _unordered
+
+
+# parallel utils
+
+Executor = Literal["process", "thread"]
+
+
+def _map_chunk(mapper: Callable[[A1], A2], chunk: list[A1]) -> list[A2]:
+    return [mapper(item) for item in chunk]
+
+
+@contextmanager
+def _pool(
+    executor: Executor | futures.Executor, workers: int | None
+) -> Iterator[futures.Executor]:
+    if isinstance(executor, futures.Executor):
+        yield executor
+        return
+
+    if executor not in _executors:
+        raise ValueError(f"Unknown executor: {executor}.")
+
+    shared = _shared_pool(executor) if workers is None else None
+    if shared is not None:
+        yield shared
+        return
+
+    match executor:
+        case "process":
+            pool = futures.ProcessPoolExecutor(max_workers=workers)
+        case _:
+            pool = futures.ThreadPoolExecutor(max_workers=workers)
+
+    with pool:
+        yield pool
+
+
+def _chunks_per_pool(workers: int | None) -> int:
+    # 4 chunks per worker keeps pool busy while amortizing pickling per item
+    return (workers or os.cpu_count() or 1) * 4
+
+
+def _chunks(items: list[A1], workers: int | None, size: int | None) -> list[list[A1]]:
+    if size is None:
+        size = max(1, len(items) // _chunks_per_pool(workers))
+
+    rest = iter(items)
+    return list(iter(lambda: list(islice(rest, size)), []))
+
+
+def cmap_parallel(
+    mapper: Callable[[A1], A2],
+    workers: int | None = None,
+    chunksize: int | None = None,
+    executor: Executor | futures.Executor = "process",
+    ordered: bool = True,
+) -> Callable[[Iterable[A1]], Iterable[A2]]:
+    """Curried `map` function that runs `mapper` in process or thread pool.
+
+    Items are sent to pool in chunks. If `chunksize` is not set it is picked based on
+    number of items and workers. With `ordered=False` results are lazily yielded
+    chunk by chunk as soon as chunk is processed. For `"process"` executor `mapper`
+    must be picklable.
+
+    `executor` can be existing pool, it is reused and not shut down. If `workers` is
+    not set, `"process"` and `"thread"` use shared pools set with `set_executor`
+    (`"process"` one is created on first use like for `in_process`). Otherwise new
+    pool is created and shut down on every call.
+
+    Example::
+
+            result = (
+                pipe(images)
+                << cmap_parallel(resize, workers=4)
+                << list
+            ).finish()
+
+    Args:
+        mapper (Callable[[A1], A2]): mapper for element of iterable.
+        workers (int | None): number of workers in pool.
+        chunksize (int | None): number of items sent to worker at once.
+        executor (Executor | futures.Executor): `"process"`, `"thread"` or pool.
+        ordered (bool): keep order of results.
+
+    Returns:
+        Callable[[Iterable[A1]], Iterable[A2]]: curried map.
+    """
+
+    def _ordered(lst: Iterable[A1]) -> Iterable[A2]:
+        chunks = _chunks(list(lst), workers, chunksize)
+        with _pool(executor, workers) as pool:
+            results = pool.map(_map_chunk, repeat(mapper), chunks)
+            return [item for chunk in results for item in chunk]
+
+    def _unordered(lst: Iterable[A1]) -> Iterable[A2]:
+        chunks = _chunks(list(lst), workers, chunksize)
+        with _pool(executor, workers) as pool:
+            tasks = [pool.submit(_map_chunk, mapper, chunk) for chunk in chunks]
+            try:
+                for task in futures.as_completed(tasks):
+                    yield from task.result()
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    return _ordered if ordered else _unordered
+
+
+def _fold_chunk(folder: Callable[[A1, A1], A1], identity: A1, chunk: list[A1]) -> A1:
+    return reduce(folder, chunk, identity)
+
+
+def fold_assoc(
+    folder: Callable[[A1, A1], A1],
+    identity: A1,
+    workers: int | None = None,
+    chunksize: int | None = None,
+    executor: Executor | futures.Executor = "process",
+) -> Callable[[Iterable[A1]], A1]:
+    """Curried parallel tree reduction for associative `folder`.
+
+    Input is split into chunks that are reduced in process or thread pool, than
+    partial results are combined pairwise in pool while there are more of them than
+    default number of chunks, the rest are combined in calling thread. `folder` must
+    be associative and `identity` must be its neutral element, e.g. `operator.add`
+    and `0` or `operator.or_` and `frozenset()`. For `"process"` executor `folder`,
+    `identity` and elements must be picklable. Pool is selected like for
+    `cmap_parallel`.
+
+    Example::
+
+            total = (
+                pipe(counters)
+                << fold_assoc(operator.add, Counter(), workers=4)
+            ).finish()
+
+    Args:
+        folder (Callable[[A1, A1], A1]): associative aggregator.
+        identity (A1): neutral element of `folder`.
+        workers (int | None): number of workers in pool.
+        chunksize (int | None): number of items reduced by worker at once.
+        executor (Executor | futures.Executor): `"process"`, `"thread"` or pool.
+
+    Returns:
+        Callable[[Iterable[A1]], A1]: curried fold.
+    """
+
+    def _fold_assoc(lst: Iterable[A1]) -> A1:
+        chunks = _chunks(list(lst), workers, chunksize)
+        if len(chunks) == 0:
+            return identity
+
+        with _pool(executor, workers) as pool:
+            partials = list(
+                pool.map(_fold_chunk, repeat(folder), repeat(identity), chunks)
+            )
+            # few partials are cheaper to combine here than to send back to pool
+            while len(partials) > _chunks_per_pool(workers):
+                pairs = _chunks(partials, workers, 2)
+                partials = list(
+                    pool.map(_fold_chunk, repeat(folder), repeat(identity), pairs)
+                )
+
+        return _fold_chunk(folder, identity, partials)
+
+    return _fold_assoc
+
+
+# offload utils
+
+_executors: dict[Executor, futures.Executor | None] = {
+    "process": None,
+    "thread": None,
+}
+
+
+def set_executor(executor: Executor, pool: futures.Executor | None) -> None:
+    """Set shared pool used by `in_process`, `in_thread` and parallel utils.
+
+    By default `in_thread` uses default executor of event loop and `in_process`
+    creates `ProcessPoolExecutor` on first use. `cmap_parallel` without `workers`
+    uses the same pools.
+
+    Example::
+
+            set_executor("thread", ThreadPoolExecutor(max_workers=8))
+
+    Args:
+        executor (Executor): `"process"` or `"thread"`.
+        pool (futures.Executor | None): pool to use, `None` for default one.
+    """
+    if executor not in _executors:
+        raise ValueError(f"Unknown executor: {executor}.")
+
+    _executors[executor] = pool
+
+
+def _shared_pool(executor: Executor) -> futures.Executor | None:
+    pool = _executors[executor]
+    if pool is None and executor == "process":
+        pool = _executors[executor] = futures.ProcessPoolExecutor()
+
+    return pool
+
+
+def _offload(executor: Executor, func: Callable[P, V]) -> Callable[P, future[V]]:
+    @wraps(func)
+    @future.returns
+    async def _wrapper(*args: P.args, **kwargs: P.kwargs) -> V:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _shared_pool(executor), partial(func, *args, **kwargs)
+        )
+
+    return _wrapper
+
+
+def in_thread(func: Callable[P, V]) -> Callable[P, future[V]]:
+    """Make sync function awaitable by running it in shared thread pool.
+
+    Example::
+
+            result = await (
+                future(read_body_async(request))
+                >> in_thread(json.loads)
+                << validate
+            )
+    """
+    return _offload("thread", func)
+
+
+def in_process(func: Callable[P, V]) -> Callable[P, future[V]]:
+    """Make sync function awaitable by running it in shared process pool.
+
+    Function and its arguments must be picklable, so wrap function where it is used
+    instead of decorating it.
+
+    Example::
+
+            result = await (
+                future(read_body_async(request))
+                >> in_process(zlib.decompress)
+                << parse
+            )
+    """
+    return _offload("process", func)
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import copy
 from dataclasses import dataclass
 from functools import wraps
 from typing import Awaitable, Callable, Generic, ParamSpec, TypeVar
 
-from fundom.core import future, hof1
+from fundom.core import Isolation, future, hof1, isolation_split, railway_handler
 
 T = TypeVar("T")
 V = TypeVar("V")
@@ -48,6 +47,7 @@ def if_none(func: Callable[[T], V]):
             )
     """
 
+    @railway_handler("none")
     @wraps(func)
     def _wrapper(t: T) -> V | None:
         match t:
@@ -60,6 +60,7 @@ def if_none(func: Callable[[T], V]):
 
 
 @hof1
+@railway_handler("none")
 def if_none_returns(replacement: V, value: T) -> V | T:
     """Replace `value` with `replacement` if one is `None`.
 
@@ -160,7 +161,8 @@ class choose_some(Generic[P, T]):  # noqa
     """Combines multiple sync functions into switch-case like statement.
 
     The first function to return non-`None` result is used. If no function passed than
-    `None` is returned. Uses deepcopy to keep arguments immutable during attempts.
+    `None` is returned. Uses deepcopy to keep arguments immutable during attempts,
+    other modes can be selected with `isolation_mode` (see `isolation`).
 
     Examples::
 
@@ -172,16 +174,20 @@ class choose_some(Generic[P, T]):  # noqa
     """
 
     funcs: list[Callable[P, T | None]]
+    check: Callable[[tuple], tuple]
+    isolate: Callable[[tuple], tuple]
 
-    def __init__(self) -> None:
+    def __init__(self, isolation_mode: Isolation = "deepcopy") -> None:
         self.funcs = []
+        self.check, self.isolate = isolation_split(isolation_mode)
 
     def __call__(self, *args: P.args, **_: P.kwargs) -> T | None:  # noqa
         if len(self.funcs) == 0:
             return None
 
+        args = self.check(args)
         for func in self.funcs:
-            copy_args = copy.deepcopy(args)
+            copy_args = self.isolate(args)
             if result := func(*copy_args):
                 return result
 
@@ -197,7 +203,8 @@ class choose_some_future(Generic[P, T]):  # noqa
     """Combines multiple sync functions into switch-case like statement.
 
     The first function to return non-`None` result is used. If no function passed than
-    `None` is returned. Uses deepcopy to keep arguments immutable during attempts.
+    `None` is returned. Uses deepcopy to keep arguments immutable during attempts,
+    other modes can be selected with `isolation_mode` (see `isolation`).
 
     Examples::
 
@@ -209,17 +216,21 @@ class choose_some_future(Generic[P, T]):  # noqa
     """
 
     funcs: list[Callable[P, Awaitable[T | None]]]
+    check: Callable[[tuple], tuple]
+    isolate: Callable[[tuple], tuple]
 
-    def __init__(self) -> None:
+    def __init__(self, isolation_mode: Isolation = "deepcopy") -> None:
         self.funcs = []
+        self.check, self.isolate = isolation_split(isolation_mode)
 
     @future.returns
     async def __call__(self, *args: P.args, **_: P.kwargs) -> future[T | None]:  # noqa
         if len(self.funcs) == 0:
             return None
 
+        args = self.check(args)
         for func in self.funcs:
-            copy_args = copy.deepcopy(args)
+            copy_args = self.isolate(args)
             if result := await func(*copy_args):
                 return result
 
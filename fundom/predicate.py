@@ -1,21 +1,138 @@
 from __future__ import annotations
 
+import asyncio
+import operator
 from dataclasses import dataclass
-from typing import Awaitable, Callable, Generic, Iterable, ParamSpec, Sized, TypeVar
-
-from fundom.core import future
+from functools import reduce
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    ParamSpec,
+    Sized,
+    TypeVar,
+)
+
+from fundom.core import _marker, future
+
+if TYPE_CHECKING:
+    import numpy as np
 
 P = ParamSpec("P")
 
 
+async def _race_predicates(
+    predicates: list[Callable[P, Awaitable[bool]]], args: tuple, stop_on: bool
+) -> bool:
+    tasks = [asyncio.ensure_future(predicate(*args)) for predicate in predicates]
+    try:
+        for task in asyncio.as_completed(tasks):
+            if await task is stop_on:
+                return stop_on
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    return not stop_on
+
+
+@dataclass(slots=True)
+class PredicateStats(Generic[P]):
+    """Runtime statistics of predicate collected by adaptive `each` and `one`.
+
+    Cost is measured on a sample of evaluations only, `timed` is its size.
+    """
+
+    predicate: Callable[P, bool]
+    calls: int = 0
+    passes: int = 0
+    timed: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def cost(self) -> float:
+        """Average evaluation time in seconds."""
+        return self.elapsed / self.timed if self.timed else 0.0
+
+    @property
+    def pass_rate(self) -> float:
+        """Smoothed share of evaluations that returned True."""
+        return (self.passes + 1) / (self.calls + 2)
+
+
+_SAMPLE_EVERY = 16
+_REORDER_EVERY = 256
+
+
+@dataclass(slots=True, init=False)
+class _adaptive_order(Generic[P]):  # noqa
+    stats: list[PredicateStats[P]]
+    stop_on: bool
+    calls: int
+
+    def __init__(self, stop_on: bool) -> None:
+        self.stats = []
+        self.stop_on = stop_on
+        self.calls = 0
+
+    def __call__(self, args: tuple) -> bool:
+        self.calls += 1
+        result = not self.stop_on
+
+        for stat in self.stats:
+            # every predicate is sampled by its own calls count, so predicates that
+            # are reached only on some inputs are timed too
+            if stat.calls % _SAMPLE_EVERY == 0:
+                start = perf_counter()
+                passed = bool(stat.predicate(*args))
+                stat.elapsed += perf_counter() - start
+                stat.timed += 1
+            else:
+                passed = bool(stat.predicate(*args))
+
+            stat.calls += 1
+            stat.passes += passed
+
+            if passed is self.stop_on:
+                result = self.stop_on
+                break
+
+        if self.calls % _REORDER_EVERY == 0:
+            self.__reorder()
+
+        return result
+
+    def __reorder(self) -> None:
+        # cost of never timed predicates is unknown, so they keep their positions
+        # and only timed ones are sorted among the rest of positions
+        slots = [idx for idx, stat in enumerate(self.stats) if stat.timed > 0]
+        ranked = sorted((self.stats[idx] for idx in slots), key=self.__rank)
+        for idx, stat in zip(slots, ranked):
+            self.stats[idx] = stat
+
+    def __rank(self, stat: PredicateStats[P]) -> float:
+        # expected cost paid per short-circuit, the lower the earlier to evaluate
+        stop_rate = stat.pass_rate if self.stop_on else 1 - stat.pass_rate
+        return stat.cost / stop_rate
+
+    def append(self, predicate: Callable[P, bool]) -> None:
+        self.stats.append(PredicateStats(predicate))
+
+
 @dataclass(slots=True, init=False)
 class _each_future(Generic[P]):  # noqa
     sync_predicates: list[Callable[P, bool]]
     async_predicates: list[Callable[P, Awaitable[bool]]]
+    concurrent: bool
 
-    def __init__(self) -> None:
+    def __init__(self, concurrent: bool = False) -> None:
         self.sync_predicates = []
         self.async_predicates = []
+        self.concurrent = concurrent
 
     @future.returns
     async def __call__(self, *args: P.args, **_: P.kwargs) -> bool:
@@ -25,6 +142,9 @@ class _each_future(Generic[P]):  # noqa
         ):
             return False
 
+        if self.concurrent:
+            return await _race_predicates(self.async_predicates, args, False)
+
         for async_predicate in self.async_predicates:
             if await async_predicate(*args) is False:
                 return False
@@ -44,7 +164,13 @@ class _each_future(Generic[P]):  # noqa
 class each(Generic[P]):  # noqa
     """Mathematical conjunction of predicates.
 
-    If no predicate passed returns True.
+    If no predicate passed returns True. With `concurrent=True` async predicates are
+    started all together and the rest of them are cancelled once any returns False,
+    otherwise they are awaited one by one.
+
+    With `adaptive=True` cost and pass rate of sync predicates are sampled at runtime
+    and predicates are periodically reordered so that cheap ones that are likely to
+    return False go first. Collected statistics are available via `stats`.
 
     Example::
 
@@ -57,19 +183,59 @@ class each(Generic[P]):  # noqa
     """
 
     predicates: list[Callable[P, bool]]
+    concurrent: bool
+    adaptive: _adaptive_order[P] | None
 
-    def __init__(self) -> None:
+    def __init__(self, concurrent: bool = False, adaptive: bool = False) -> None:
         self.predicates = []
+        self.concurrent = concurrent
+        self.adaptive = _adaptive_order(False) if adaptive else None
 
     def __call__(self, *args: P.args, **_: P.kwargs) -> bool:  # noqa
+        if self.adaptive is not None:
+            return self.adaptive(args)
+
         return all(predicate(*args) for predicate in self.predicates)
 
+    def compile(self) -> Callable[P, bool]:  # noqa: A003
+        """Build single short-circuiting function out of predicates tree.
+
+        Nested `each` and `one` are flattened, bounds of `len_*` predicates (and
+        `is_empty`/`is_not_empty`) combined with conjunction are merged into single
+        range check and duplicate predicates are dropped. Predicates added after
+        `compile` are not included in result.
+
+        Example::
+
+                p = (
+                    each()
+                    << (one() << is_admin << is_moderator)
+                    << len_more_then(3)
+                    << len_less_then(10)
+                ).compile()
+
+        Returns:
+            Callable[P, bool]: compiled predicate.
+        """
+        return _compile(self)
+
     def __lshift__(self, nxt: Callable[P, bool]) -> each[P]:
         self.predicates.append(nxt)
+        if self.adaptive is not None:
+            self.adaptive.append(nxt)
         return self
 
+    @property
+    def stats(self) -> list[PredicateStats[P]]:
+        """Statistics of predicates in current evaluation order, empty if not adaptive.
+
+        Returns:
+            list[PredicateStats[P]]: predicates statistics.
+        """
+        return [] if self.adaptive is None else list(self.adaptive.stats)
+
     def __rshift__(self, nxt: Callable[P, Awaitable[bool]]) -> _each_future[P]:
-        ef = _each_future()
+        ef = _each_future(self.concurrent)
 
         for predicate in self.predicates:
             ef = ef << predicate
@@ -82,10 +248,12 @@ class _one_future(Generic[P]):  # noqa
 
     sync_predicates: list[Callable[P, bool]]
     async_predicates: list[Callable[P, Awaitable[bool]]]
+    concurrent: bool
 
-    def __init__(self) -> None:
+    def __init__(self, concurrent: bool = False) -> None:
         self.sync_predicates = []
         self.async_predicates = []
+        self.concurrent = concurrent
 
     @future.returns
     async def __call__(self, *args: P.args, **_: P.kwargs) -> bool:
@@ -95,6 +263,9 @@ class _one_future(Generic[P]):  # noqa
         ):
             return True
 
+        if self.concurrent:
+            return await _race_predicates(self.async_predicates, args, True)
+
         for async_predicate in self.async_predicates:
             if await async_predicate(*args) is True:
                 return True
@@ -114,7 +285,13 @@ class _one_future(Generic[P]):  # noqa
 class one(Generic[P]):  # noqa
     """Mathematical disjunction of predicates.
 
-    If no predicate passed returns False.
+    If no predicate passed returns False. With `concurrent=True` async predicates are
+    started all together and the rest of them are cancelled once any returns True,
+    otherwise they are awaited one by one.
+
+    With `adaptive=True` cost and pass rate of sync predicates are sampled at runtime
+    and predicates are periodically reordered so that cheap ones that are likely to
+    return True go first. Collected statistics are available via `stats`.
 
     Example::
 
@@ -127,19 +304,58 @@ class one(Generic[P]):  # noqa
     """
 
     predicates: list[Callable[P, bool]]
+    concurrent: bool
+    adaptive: _adaptive_order[P] | None
 
-    def __init__(self) -> None:
+    def __init__(self, concurrent: bool = False, adaptive: bool = False) -> None:
         self.predicates = []
+        self.concurrent = concurrent
+        self.adaptive = _adaptive_order(True) if adaptive else None
 
     def __call__(self, *args: P.args, **_: P.kwargs) -> bool:  # noqa
+        if self.adaptive is not None:
+            return self.adaptive(args)
+
         return any(predicate(*args) for predicate in self.predicates)
 
+    def compile(self) -> Callable[P, bool]:  # noqa: A003
+        """Build single short-circuiting function out of predicates tree.
+
+        Tree is normalized the same way as on `each.compile`: nested predicates are
+        flattened and duplicates are dropped. Predicates added after `compile` are not
+        included in result.
+
+        Example::
+
+                p = (
+                    one()
+                    << is_admin
+                    << (each() << is_moderator << len_more_then(3))
+                    << (one() << is_admin << is_owner)
+                ).compile()  # is_admin is checked once
+
+        Returns:
+            Callable[P, bool]: compiled predicate.
+        """
+        return _compile(self)
+
     def __lshift__(self, nxt: Callable[P, bool]) -> one[P]:
         self.predicates.append(nxt)
+        if self.adaptive is not None:
+            self.adaptive.append(nxt)
         return self
 
+    @property
+    def stats(self) -> list[PredicateStats[P]]:
+        """Statistics of predicates in current evaluation order, empty if not adaptive.
+
+        Returns:
+            list[PredicateStats[P]]: predicates statistics.
+        """
+        return [] if self.adaptive is None else list(self.adaptive.stats)
+
     def __rshift__(self, nxt: Callable[P, Awaitable[bool]]) -> _one_future[P]:
-        ef = _one_future()
+        ef = _one_future(self.concurrent)
 
         for predicate in self.predicates:
             ef = ef << predicate
@@ -147,40 +363,45 @@ class one(Generic[P]):  # noqa
         return ef >> nxt
 
 
-def len_more_then(length: int):
-    """If `iterable` length is strictly more than `length`."""
+@dataclass(slots=True, frozen=True)
+class _len_range:  # noqa
+    """Inclusive bounds of length used to merge `len_*` predicates."""
 
-    def _predicate(iterable: Iterable) -> bool:
-        return length < len(iterable)
+    lower: int = 0
+    upper: int | None = None
 
-    return _predicate
+    def __and__(self, other: _len_range) -> _len_range:
+        match (self.upper, other.upper):
+            case (None, upper) | (upper, None):
+                pass
+            case (left, right):
+                upper = min(left, right)
 
+        return _len_range(max(self.lower, other.lower), upper)
 
-def len_less_then(length: int):
-    """If `iterable` length is strictly less than `length`."""
+    def __call__(self, iterable: Sized) -> bool:
+        size = len(iterable)
+        return self.lower <= size and (self.upper is None or size <= self.upper)
 
-    def _predicate(iterable: Iterable) -> bool:
-        return length > len(iterable)
 
-    return _predicate
+def len_more_then(length: int) -> Callable[[Sized], bool]:
+    """If `iterable` length is strictly more than `length`."""
+    return _len_range(lower=length + 1)
 
 
-def len_less_or_equals(length: int):
-    """If `iterable` length is less or equals `length`."""
+def len_less_then(length: int) -> Callable[[Sized], bool]:
+    """If `iterable` length is strictly less than `length`."""
+    return _len_range(upper=length - 1)
 
-    def _predicate(iterable: Iterable) -> bool:
-        return len(iterable) <= length
 
-    return _predicate
+def len_less_or_equals(length: int) -> Callable[[Sized], bool]:
+    """If `iterable` length is less or equals `length`."""
+    return _len_range(upper=length)
 
 
-def len_more_or_equals(length: int):
+def len_more_or_equals(length: int) -> Callable[[Sized], bool]:
     """If `iterable` length is more or equals `length`."""
-
-    def _predicate(iterable: Iterable) -> bool:
-        return len(iterable) >= length
-
-    return _predicate
+    return _len_range(lower=length)
 
 
 TSized = TypeVar("TSized", bound=Sized)
@@ -194,3 +415,277 @@ def is_empty(obj: TSized) -> bool:
 def is_not_empty(obj: TSized) -> bool:
     """If `obj` is not empty."""
     return len(obj) != 0
+
+
+# compilation utils
+
+
+def _len_bounds(predicate: Any) -> _len_range | None:
+    if predicate is is_empty:
+        return _len_range(upper=0)
+
+    if predicate is is_not_empty:
+        return _len_range(lower=1)
+
+    return predicate if type(predicate) is _len_range else None
+
+
+def _dedupe(predicates: list[Any]) -> list[Any]:
+    unique: list[Any] = []
+    for predicate in predicates:
+        if predicate not in unique:
+            unique.append(predicate)
+
+    return unique
+
+
+def _flatten(tree: each | one) -> tuple[str, list[Any]]:
+    """Normalize predicates tree into `("and" | "or", children)` node."""
+    kind = "and" if isinstance(tree, each) else "or"
+    children: list[Any] = []
+
+    for predicate in tree.predicates:
+        match predicate:
+            case each() | one():
+                child_kind, grandchildren = _flatten(predicate)
+                if child_kind == kind or len(grandchildren) == 1:
+                    children.extend(grandchildren)
+                else:
+                    children.append((child_kind, grandchildren))
+            case _:
+                children.append(_len_bounds(predicate) or predicate)
+
+    if kind == "and":
+        ranges = [child for child in children if isinstance(child, _len_range)]
+        if len(ranges) > 1:
+            merged = reduce(operator.and_, ranges)
+            first = children.index(ranges[0])
+            children = [c for c in children if not isinstance(c, _len_range)]
+            children.insert(first, merged)
+
+    return kind, _dedupe(children)
+
+
+def _expression(node: Any, namespace: dict[str, Any]) -> str:
+    match node:
+        case ("and" | "or" as kind, children):
+            if len(children) == 0:
+                return "True" if kind == "and" else "False"
+
+            parts = [_expression(child, namespace) for child in children]
+            return "(" + f" {kind} ".join(parts) + ")"
+        case _len_range(lower=lower, upper=upper):
+            if upper is not None and lower > upper:
+                return "False"
+
+            upper_check = "" if upper is None else f" <= {upper}"
+            return f"({lower} <= len(args[0]){upper_check})"
+        case predicate:
+            name = f"_p{len(namespace)}"
+            namespace[name] = predicate
+            return f"{name}(*args)"
+
+
+def _compile(tree: each | one) -> Callable[..., bool]:
+    namespace: dict[str, Any] = {}
+    expression = _expression(_flatten(tree), namespace)
+    source = f"def _compiled(*args):\n    return True if {expression} else False"
+    exec(source, namespace)  # noqa: S102
+    return namespace["_compiled"]
+
+
+# rule set utils
+
+
+@dataclass(slots=True, init=False)
+class rule_set(Generic[P]):  # noqa
+    """Evaluates many named predicate trees against the same input at once.
+
+    Trees are normalized like on `each.compile` and their predicates and subtrees are
+    shared, so every distinct predicate is evaluated at most once per input no matter
+    how many rules use it. Returns names of matched rules in order of `rules`.
+
+    Example::
+
+            route = rule_set(
+                {
+                    "admin": each() << is_authorized << is_admin,
+                    "user": each() << is_authorized << (one() << is_user << is_guest),
+                }
+            )
+            route(request)  # ["user"]
+    """
+
+    nodes: list[tuple[str, Any]]
+    rules: dict[str, int]
+
+    def __init__(self, rules: dict[str, Callable[P, bool]]) -> None:
+        self.nodes = []
+        self.rules = {}
+        composites: dict[tuple[str, tuple[int, ...]], int] = {}
+        leaves: dict[Any, int] = {}
+
+        def _intern(node: Any) -> int:
+            match node:
+                case ("and" | "or" as kind, children):
+                    key = (kind, tuple(_intern(child) for child in children))
+                    if key not in composites:
+                        composites[key] = len(self.nodes)
+                        self.nodes.append(key)
+                    return composites[key]
+                case predicate:
+                    # unhashable predicates are interned by identity
+                    key = predicate
+                    if not isinstance(predicate, Hashable):
+                        key = id(predicate)
+
+                    if key not in leaves:
+                        leaves[key] = len(self.nodes)
+                        self.nodes.append(("leaf", predicate))
+                    return leaves[key]
+
+        for name, tree in rules.items():
+            match tree:
+                case each() | one():
+                    self.rules[name] = _intern(_flatten(tree))
+                case predicate:
+                    self.rules[name] = _intern(_len_bounds(predicate) or predicate)
+
+    def __call__(self, *args: P.args, **_: P.kwargs) -> list[str]:  # noqa
+        results: list[bool | None] = [None] * len(self.nodes)
+
+        def _evaluate(idx: int) -> bool:
+            result = results[idx]
+            if result is None:
+                match self.nodes[idx]:
+                    case ("leaf", predicate):
+                        result = bool(predicate(*args))
+                    case ("and", children):
+                        result = all(_evaluate(child) for child in children)
+                    case (_, children):
+                        result = any(_evaluate(child) for child in children)
+
+                results[idx] = result
+
+            return result
+
+        return [name for name, idx in self.rules.items() if _evaluate(idx)]
+
+
+# vectorization utils
+
+
+class _vectorized(_marker[P, bool]):  # noqa
+    """Predicate with vectorized variant attached by `vectorized`."""
+
+    def __init__(
+        self,
+        predicate: Callable[P, bool],
+        mask_func: Callable[[np.ndarray], np.ndarray],
+    ) -> None:
+        super().__init__(predicate)
+        self.mask = mask_func
+
+
+def vectorized(mask_func: Callable[[np.ndarray], np.ndarray]):
+    """Attach vectorized variant of predicate to be used by `mask`.
+
+    Vectorized variant receives whole array and must return boolean mask of the same
+    length.
+
+    Example::
+
+            @vectorized(lambda values: values > 3)
+            def more_than_3(x: int) -> bool:
+                return x > 3
+    """
+
+    def _decorator(predicate: Callable[P, bool]) -> Callable[P, bool]:
+        return _vectorized(predicate, mask_func)
+
+    return _decorator
+
+
+_ARRAY_SCALARS = frozenset({bool, int, float, complex, str, bytes})
+
+
+def _as_arrays(values: Any) -> tuple[np.ndarray, np.ndarray]:
+    """Convert `values` to native array for vectorized checks and array of elements.
+
+    Elements array holds original objects, so predicates called for every element
+    get the same values as on direct call.
+    """
+    import numpy as np
+
+    if isinstance(values, np.ndarray):
+        return values, values
+
+    items = list(values)
+    types = {type(item) for item in items}
+    if len(types) <= 1 and types <= _ARRAY_SCALARS:
+        return np.asarray(items), np.array(items, dtype=object)
+
+    # filled element by element, so sequences like tuples are not turned into rows
+    array = np.empty(len(items), dtype=object)
+    for idx, item in enumerate(items):
+        array[idx] = item
+
+    return array, array
+
+
+def _mask(node: Any, values: np.ndarray, items: np.ndarray) -> np.ndarray:
+    import numpy as np
+
+    match node:
+        case ("and" | "or" as kind, children):
+            result = np.full(len(values), kind == "and")
+            for child in children:
+                # only rows with undecided result are passed to the next predicate
+                rows = np.flatnonzero(result if kind == "and" else ~result)
+                if len(rows) == 0:
+                    break
+                result[rows] = _mask(child, values[rows], items[rows])
+
+            return result
+        case _len_range(lower=lower, upper=upper):
+            if values.dtype.kind in "US":
+                lengths = np.char.str_len(values)
+            else:
+                lengths = np.fromiter(map(len, values), dtype=int, count=len(values))
+
+            result = lengths >= lower
+            return result if upper is None else result & (lengths <= upper)
+        case _vectorized():
+            return np.asarray(node.mask(values), dtype=bool)
+        case predicate:
+            return np.fromiter(map(predicate, items), dtype=bool, count=len(items))
+
+
+def mask(predicate: Callable[[Any], bool], values: Any) -> np.ndarray:
+    """Evaluate predicate over every element of array and return boolean mask.
+
+    Requires `numpy` (`fundom[numpy]` extra). `each` and `one` are evaluated as `&`
+    and `|` of masks of their predicates and only rows that are not decided yet are
+    passed further. `len_*` predicates, `is_empty`, `is_not_empty` and predicates
+    decorated with `vectorized` are evaluated over whole array at once, others are
+    called for every element with the same object as in `values`.
+
+    Example::
+
+            names = np.array(["", "bob", "alice"])
+            mask(each() << is_not_empty << len_less_then(4), names)  # [F, T, F]
+
+    Args:
+        predicate (Callable[[Any], bool]): to evaluate.
+        values (Any): array or sequence of elements.
+
+    Returns:
+        np.ndarray: boolean mask.
+    """
+    match predicate:
+        case each() | one():
+            node = _flatten(predicate)
+        case _:
+            node = _len_bounds(predicate) or predicate
+
+    return _mask(node, *_as_arrays(values))
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import copy
+import asyncio
+import sys
+from collections import deque
 from dataclasses import dataclass
-from functools import wraps
+from functools import partial, wraps
 from typing import Awaitable, Callable, Generic, ParamSpec, TypeVar
 
-from fundom.core import future, hof1, hof2
+from fundom.core import Isolation, future, hof1, hof2, isolation_split, railway_handler
 
 V = TypeVar("V")
 T = TypeVar("T")
@@ -49,6 +51,7 @@ def if_error(func: Callable[[T], V]):
             )
     """
 
+    @railway_handler("error")
     @wraps(func)
     def _wrapper(t: T) -> V | Exception:
         match t:
@@ -89,6 +92,7 @@ def if_ok_returns(replacement: V, value: T) -> V | T:
 
 
 @hof1
+@railway_handler("error")
 def if_error_returns(replacement: V, value: T) -> V | T:
     """Replace `value` with `replacement` if one is `Exception`.
 
@@ -117,10 +121,70 @@ def if_error_returns(replacement: V, value: T) -> V | T:
 P = ParamSpec("P")
 
 
-def safe(func: Callable[P, V]) -> Callable[P, V | Exception]:
+_keep_tracebacks = True
+
+
+def set_keep_tracebacks(keep: bool) -> None:
+    """Set if errors captured by `safe` and `safe_future` keep their tracebacks.
+
+    Traceback references frames of failed call with all their locals, so dropping it
+    lets them be freed while error value flows through the pipeline. Applies to
+    decorators that do not set `keep_traceback` themselves.
+
+    Example::
+
+            set_keep_tracebacks(False)
+
+    Args:
+        keep (bool): keep tracebacks.
+    """
+    global _keep_tracebacks
+    _keep_tracebacks = keep
+
+
+def _strip_traceback(err: BaseException, outer: BaseException | None) -> None:
+    # only exceptions raised inside the call are modified, implicit link to `outer`
+    # exception that caller was handling is cut instead of stripping its traceback
+    seen: set[int] = set()
+    current: BaseException | None = err
+    while current is not None and current is not outer and id(current) not in seen:
+        seen.add(id(current))
+        current.__traceback__ = None
+        if outer is not None and current.__context__ is outer:
+            current.__context__ = None
+        current = current.__cause__ or current.__context__
+
+
+def _captured(
+    err: Exception,
+    outer: BaseException | None,
+    keep_traceback: bool | None,
+    errors: dict[type[Exception], Exception] | None,
+) -> Exception:
+    if errors is not None:
+        for err_type in type(err).__mro__:
+            if (replacement := errors.get(err_type)) is not None:
+                return replacement
+
+    if not (_keep_tracebacks if keep_traceback is None else keep_traceback):
+        _strip_traceback(err, outer)
+
+    return err
+
+
+def safe(
+    func: Callable[P, V] | None = None,
+    *,
+    keep_traceback: bool | None = None,
+    errors: dict[type[Exception], Exception] | None = None,
+) -> Callable[P, V | Exception]:
     """Decorator for sync function that might raise an exception.
 
-    Excepts exception and returns that instead.
+    Excepts exception and returns that instead. With `keep_traceback=False` traceback
+    of returned exception (and of exceptions it was caused by inside the call) is
+    dropped, by default `set_keep_tracebacks` setting is used. Exceptions of types
+    from `errors` and of their subclasses are replaced with preallocated value of the
+    closest listed type.
 
     Example::
 
@@ -129,22 +193,37 @@ def safe(func: Callable[P, V]) -> Callable[P, V | Exception]:
                 return dct[key]  # raises error
 
             # type: str, dict -> Any | Exception
+
+            MISSING = KeyError("missing")
+
+            @safe(keep_traceback=False, errors={KeyError: MISSING})
+            def get_user(users: dict, uid: int) -> User:
+                return users[uid]
     """
+    if func is None:
+        return partial(safe, keep_traceback=keep_traceback, errors=errors)
 
     @wraps(func)
     def _wrapper(*args: P.args, **kwargs: P.kwargs) -> V | Exception:
+        outer = sys.exc_info()[1]
         try:
             return func(*args, **kwargs)
         except Exception as err:
-            return err
+            return _captured(err, outer, keep_traceback, errors)
 
     return _wrapper
 
 
-def safe_future(func: Callable[P, Awaitable[V]]) -> Callable[P, future[V | TError]]:
+def safe_future(
+    func: Callable[P, Awaitable[V]] | None = None,
+    *,
+    keep_traceback: bool | None = None,
+    errors: dict[type[Exception], Exception] | None = None,
+) -> Callable[P, future[V | TError]]:
     """Decorator for async function that might raise an exception.
 
-    Excepts exception and returns that instead.
+    Excepts exception and returns that instead. `keep_traceback` and `errors` work
+    the same way as for `safe`.
 
     Example::
 
@@ -154,14 +233,17 @@ def safe_future(func: Callable[P, Awaitable[V]]) -> Callable[P, future[V | TErro
 
             # type: str -> Database | Exception
     """
+    if func is None:
+        return partial(safe_future, keep_traceback=keep_traceback, errors=errors)
 
     @wraps(func)
     @future.returns
     async def _wrapper(*args: P.args, **kwargs: P.kwargs) -> V | TError:
+        outer = sys.exc_info()[1]
         try:
             return await func(*args, **kwargs)
         except Exception as err:
-            return err
+            return _captured(err, outer, keep_traceback, errors)
 
     return _wrapper
 
@@ -235,7 +317,8 @@ class choose_ok(Generic[P, T]):  # noqa
 
     The first function to return non-`Exception` result is used. If no function passed
     than `EmptyChooseOkError` is raised. Uses deepcopy to keep arguments immutable
-    during attempts.
+    during attempts, other modes can be selected with `isolation_mode` (see
+    `isolation`).
 
     Examples::
 
@@ -247,16 +330,20 @@ class choose_ok(Generic[P, T]):  # noqa
     """
 
     funcs: list[Callable[P, T | TError]]
+    check: Callable[[tuple], tuple]
+    isolate: Callable[[tuple], tuple]
 
-    def __init__(self) -> None:
+    def __init__(self, isolation_mode: Isolation = "deepcopy") -> None:
         self.funcs = []
+        self.check, self.isolate = isolation_split(isolation_mode)
 
     def __call__(self, *args: P.args, **_: P.kwargs) -> T | TError:  # noqa
         if len(self.funcs) == 0:
             return EmptyChooseOkError()
 
+        args = self.check(args)
         for func in self.funcs:
-            copy_args = copy.deepcopy(args)
+            copy_args = self.isolate(args)
             match func(*copy_args):
                 case Exception():
                     continue
@@ -276,29 +363,47 @@ class choose_ok_future(Generic[P, T]):  # noqa
 
     The first function to return non-`Exception` result is used. If no function passed
     than `EmptyChooseOkError` is raised. Uses deepcopy to keep arguments immutable
-    during attempts.
+    during attempts, other modes can be selected with `isolation_mode` (see
+    `isolation`).
+
+    If `hedge_delay` is set options are raced: next option is started when previous
+    one fails or does not finish in `hedge_delay` seconds (`0` starts all of them at
+    once). The first non-`Exception` result to arrive is used (options finished at
+    the same time are checked in priority order) and options still running are
+    cancelled.
 
     Examples::
 
             f = (
-                choose_ok_future()
-                | create_linked_node
-                | create_isolated_node
+                choose_ok_future(hedge_delay=0.05)
+                | get_node_from_primary
+                | get_node_from_replica
             )
     """
 
     funcs: list[Callable[P, T | TError]]
+    check: Callable[[tuple], tuple]
+    isolate: Callable[[tuple], tuple]
+    hedge_delay: float | None
 
-    def __init__(self) -> None:
+    def __init__(
+        self, isolation_mode: Isolation = "deepcopy", hedge_delay: float | None = None
+    ) -> None:
         self.funcs = []
+        self.check, self.isolate = isolation_split(isolation_mode)
+        self.hedge_delay = hedge_delay
 
     @future.returns
     async def __call__(self, *args: P.args, **_: P.kwargs) -> T | TError:  # noqa
         if len(self.funcs) == 0:
             return EmptyChooseOkError()
 
+        args = self.check(args)
+        if self.hedge_delay is not None:
+            return await self.__race(args)
+
         for func in self.funcs:
-            copy_args = copy.deepcopy(args)
+            copy_args = self.isolate(args)
             match await func(*copy_args):
                 case Exception():
                     continue
@@ -307,6 +412,37 @@ class choose_ok_future(Generic[P, T]):  # noqa
 
         return FailedChooseOkError(*args)
 
+    async def __race(self, args: tuple) -> T | TError:
+        options = deque(enumerate(self.funcs))
+        priority: dict[asyncio.Future, int] = {}
+        pending: set[asyncio.Future] = set()
+
+        try:
+            while options or pending:
+                if options:
+                    idx, func = options.popleft()
+                    task = asyncio.ensure_future(func(*self.isolate(args)))
+                    priority[task] = idx
+                    pending.add(task)
+
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self.hedge_delay if options else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                for task in sorted(done, key=priority.__getitem__):
+                    match task.result():
+                        case Exception():
+                            continue
+                        case ok:
+                            return ok
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return FailedChooseOkError(*args)
+
     def __or__(self, option: Callable[P, T]) -> choose_ok[P, T]:
         self.funcs.append(option)
         return self
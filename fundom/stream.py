@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    Literal,
+    TypeVar,
+)
+
+from fundom.core import future
+
+T = TypeVar("T")
+V = TypeVar("V")
+
+StageKind = Literal[
+    "map", "filter", "take", "chunk", "flat_map", "amap", "afilter", "buffer"
+]
+
+
+@dataclass(slots=True, frozen=True)
+class stage:  # noqa
+    """Lazy `stream` or `astream` stage created by `smap`, `sfilter`, `take` etc."""
+
+    kind: StageKind
+    arg: Any
+
+
+def smap(mapper: Callable[[T], V]) -> stage:
+    """Stream stage that maps every element with `mapper`.
+
+    Same as passing `mapper` to `stream` directly.
+    """
+    return stage("map", mapper)
+
+
+def sfilter(predicate: Callable[[T], bool]) -> stage:
+    """Stream stage that passes only elements satisfying `predicate`."""
+    return stage("filter", predicate)
+
+
+def take(count: int) -> stage:
+    """Stream stage that passes first `count` elements and stops the stream."""
+    return stage("take", count)
+
+
+def chunk(size: int) -> stage:
+    """Stream stage that groups elements into lists of `size` elements.
+
+    The last list may be shorter.
+    """
+    return stage("chunk", size)
+
+
+def flat_map(mapper: Callable[[T], Iterable[V]]) -> stage:
+    """Stream stage that maps every element to iterable and flattens result."""
+    return stage("flat_map", mapper)
+
+
+def amap(mapper: Callable[[T], Awaitable[V]], limit: int = 1) -> stage:
+    """Async stream stage that maps every element with async `mapper`.
+
+    Up to `limit` elements are mapped concurrently, order is kept. Same as passing
+    `mapper` to `astream` with `>>` when `limit` is 1.
+    """
+    return stage("amap", (mapper, limit))
+
+
+def afilter(predicate: Callable[[T], Awaitable[bool]], limit: int = 1) -> stage:
+    """Async stream stage that passes only elements satisfying async `predicate`.
+
+    Up to `limit` elements are checked concurrently, order is kept.
+    """
+    return stage("afilter", (predicate, limit))
+
+
+def buffer(size: int) -> stage:
+    """Async stream stage that prefetches up to `size` elements from previous stages.
+
+    Previous stages run in separate task and are paused once buffer is full.
+    """
+    return stage("buffer", size)
+
+
+def _body(stages: tuple[stage, ...], idx: int, indent: int) -> list[str]:
+    pad = "    " * indent
+    if idx == len(stages):
+        return [f"{pad}yield x"]
+
+    name = f"_s{idx}"
+    match stages[idx].kind:
+        case "map":
+            return [f"{pad}x = {name}(x)", *_body(stages, idx + 1, indent)]
+        case "filter":
+            return [f"{pad}if {name}(x):", *_body(stages, idx + 1, indent + 1)]
+        case "flat_map":
+            return [f"{pad}for x in {name}(x):", *_body(stages, idx + 1, indent + 1)]
+        case "take":
+            return [
+                f"{pad}_c{idx} += 1",
+                *_body(stages, idx + 1, indent),
+                f"{pad}if _c{idx} >= {name}:",
+                f"{pad}    return",
+            ]
+        case kind:
+            raise ValueError(f"Unknown stream stage: {kind}.")
+
+
+@lru_cache(maxsize=256)
+def _fused_factory(kinds: tuple[StageKind, ...]) -> Callable[..., Callable]:
+    """Generate factory of generator function that runs stages of `kinds` in one loop.
+
+    Source depends only on kinds of stages, their arguments are bound by factory, so
+    it is generated once per shape of stream.
+    """
+    stages = tuple(stage(kind, None) for kind in kinds)
+    names = [f"_s{idx}" for idx in range(len(stages))]
+    lines = [f"def _factory({', '.join(names)}):", "    def _fused(source):"]
+    for idx, kind in enumerate(kinds):
+        if kind == "take":
+            lines.append(f"        if _s{idx} <= 0:")
+            lines.extend(["            return", f"        _c{idx} = 0"])
+
+    lines.append("        for x in source:")
+    lines.extend(_body(stages, 0, 3))
+    lines.append("    return _fused")
+
+    namespace: dict[str, Any] = {}
+    exec("\n".join(lines), namespace)  # noqa: S102
+    return namespace["_factory"]
+
+
+def _fuse(stages: tuple[stage, ...]) -> Callable[[Iterable], Iterator]:
+    """Get single generator function that runs all `stages` in one loop."""
+    factory = _fused_factory(tuple([stg.kind for stg in stages]))
+    return factory(*[stg.arg for stg in stages])
+
+
+def _chunked(items: Iterator[T], size: int) -> Iterator[list[T]]:
+    return iter(lambda: list(islice(items, size)), [])
+
+
+@dataclass(slots=True, frozen=True)
+class stream(Generic[T]):  # noqa
+    """Lazy pipeline over iterable.
+
+    Stages passed with `<<` are only recorded and are fused into single generator
+    loop when stream is consumed, so there is one frame per element instead of one
+    per stage. Plain functions are treated as `smap` stages. Stream is consumed with
+    iteration or `finish`.
+
+    Example::
+
+            result: list[int] = (
+                stream(range(1_000_000))
+                << (lambda x: x * 3)
+                << sfilter(lambda x: x % 2 == 0)
+                << take(10)
+            ).finish()
+    """
+
+    source: Iterable
+    stages: tuple[stage, ...] = ()
+
+    def __lshift__(self, nxt: stage | Callable[[T], V]) -> stream[V]:
+        match nxt:
+            case stage():
+                return stream(self.source, (*self.stages, nxt))
+            case mapper:
+                return stream(self.source, (*self.stages, smap(mapper)))
+
+    def __iter__(self) -> Iterator[T]:
+        items: Iterable = self.source
+        start = 0
+
+        # chunk stages split stream into fused segments
+        for idx, stg in enumerate(self.stages):
+            if stg.kind == "chunk":
+                items = _chunked(_fuse(self.stages[start:idx])(items), stg.arg)
+                start = idx + 1
+
+        return _fuse(self.stages[start:])(items)
+
+    def finish(self) -> list[T]:
+        """Finish `stream` by consuming it into list.
+
+        Example::
+
+                result = (stream(range(10)) << take(3)).finish()  # [0, 1, 2]
+
+        Returns:
+            list[T]: stream elements.
+        """
+        return list(self)
+
+
+# async streams
+
+
+@dataclass(slots=True, frozen=True)
+class _failure:  # noqa
+    error: Exception
+
+
+_END = object()
+
+
+# every stage closes previous one once it is closed itself, so closing the last
+# stage stops in-flight work of the whole pipeline down to the source
+
+
+async def _aiter(source: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    if not hasattr(source, "__aiter__"):
+        for item in source:
+            yield item
+        return
+
+    items = source.__aiter__()
+    try:
+        async for item in items:
+            yield item
+    finally:
+        if hasattr(items, "aclose"):
+            await items.aclose()
+
+
+async def _amap(
+    items: AsyncIterator[T], mapper: Callable[[T], Awaitable[V]], limit: int
+) -> AsyncIterator[V]:
+    pending: deque[asyncio.Future[V]] = deque()
+    try:
+        async for item in items:
+            pending.append(asyncio.ensure_future(mapper(item)))
+            if len(pending) >= limit:
+                yield await pending.popleft()
+
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+        await items.aclose()
+
+
+async def _afilter(
+    items: AsyncIterator[T], predicate: Callable[[T], Awaitable[bool]], limit: int
+) -> AsyncIterator[T]:
+    async def _check(item: T) -> tuple[T, bool]:
+        return item, await predicate(item)
+
+    checked = _amap(items, _check, limit)
+    try:
+        async for item, keep in checked:
+            if keep:
+                yield item
+    finally:
+        await checked.aclose()
+
+
+async def _buffer(items: AsyncIterator[T], size: int) -> AsyncIterator[T]:
+    queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+
+    async def _produce() -> None:
+        try:
+            async for item in items:
+                await queue.put(item)
+        except Exception as err:
+            await queue.put(_failure(err))
+        else:
+            await queue.put(_END)
+
+    producer = asyncio.ensure_future(_produce())
+    try:
+        while (item := await queue.get()) is not _END:
+            if isinstance(item, _failure):
+                raise item.error
+
+            yield item
+    finally:
+        producer.cancel()
+        await asyncio.wait([producer])
+        await items.aclose()
+
+
+async def _sync_stage(items: AsyncIterator[T], stg: stage) -> AsyncIterator[Any]:
+    try:
+        match stg.kind:
+            case "map":
+                async for item in items:
+                    yield stg.arg(item)
+            case "filter":
+                async for item in items:
+                    if stg.arg(item):
+                        yield item
+            case "flat_map":
+                async for item in items:
+                    for sub_item in stg.arg(item):
+                        yield sub_item
+            case "take":
+                count = stg.arg
+                if count > 0:
+                    async for item in items:
+                        yield item
+                        count -= 1
+                        if count == 0:
+                            break
+            case "chunk":
+                batch: list[T] = []
+                async for item in items:
+                    batch.append(item)
+                    if len(batch) == stg.arg:
+                        yield batch
+                        batch = []
+
+                if batch:
+                    yield batch
+            case kind:
+                raise ValueError(f"Unknown stream stage: {kind}.")
+    finally:
+        # for `take` stops in-flight work of previous stages right away
+        await items.aclose()
+
+
+@dataclass(slots=True, frozen=True)
+class astream(Generic[T]):  # noqa
+    """Lazy pipeline over async (or sync) iterable.
+
+    Sync stages are passed with `<<` and async ones with `>>` like for `future`,
+    plain functions are treated as `smap` and `amap` stages respectively. `amap`
+    and `afilter` run up to `limit` coroutines concurrently, `buffer` prefetches
+    elements in separate task. Elements are pulled from source only when consumer
+    needs them, so slow consumer slows down the whole pipeline. Stream is consumed
+    with `async for` or awaiting `finish`.
+
+    Example::
+
+            async for users in (
+                astream(iterate_pages_async(url))
+                << flat_map(lambda page: page["items"])
+                >> amap(get_user_async, limit=10)
+                << chunk(100)
+            ):
+                ...
+    """
+
+    source: Iterable | AsyncIterable
+    stages: tuple[stage, ...] = ()
+
+    def __lshift__(self, nxt: stage | Callable[[T], V]) -> astream[V]:
+        match nxt:
+            case stage():
+                return astream(self.source, (*self.stages, nxt))
+            case mapper:
+                return astream(self.source, (*self.stages, smap(mapper)))
+
+    def __rshift__(self, nxt: stage | Callable[[T], Awaitable[V]]) -> astream[V]:
+        match nxt:
+            case stage():
+                return astream(self.source, (*self.stages, nxt))
+            case mapper:
+                return astream(self.source, (*self.stages, amap(mapper)))
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        items = _aiter(self.source)
+
+        for stg in self.stages:
+            match stg.kind:
+                case "amap":
+                    items = _amap(items, *stg.arg)
+                case "afilter":
+                    items = _afilter(items, *stg.arg)
+                case "buffer":
+                    items = _buffer(items, stg.arg)
+                case _:
+                    items = _sync_stage(items, stg)
+
+        return items
+
+    @future.returns
+    async def finish(self) -> list[T]:
+        """Finish `astream` by consuming it into list.
+
+        Example::
+
+                result = await (astream(get_pages_async()) << take(3)).finish()
+
+        Returns:
+            future[list[T]]: stream elements.
+        """
+        return [item async for item in self]
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import copy
+import logging
+from dataclasses import dataclass, field
+from functools import partial
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Sequence, TypeVar
+
+T = TypeVar("T")
+V = TypeVar("V")
+
+HISTOGRAM_SIZE = 32
+
+logger = logging.getLogger("fundom")
+
+
+def stage_name(func: Callable) -> str:
+    """Get name stage is reported with: qualname of function or its type.
+
+    Partials and wrappers exposing `__wrapped__` are reported with name of wrapped
+    function.
+
+    Example::
+
+            stage_name(str_split(","))  # "split"
+    """
+    while True:
+        if isinstance(func, partial):
+            func = func.func
+        elif hasattr(func, "__wrapped__"):
+            func = func.__wrapped__
+        else:
+            break
+
+    return getattr(func, "__qualname__", type(func).__qualname__)
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Call count and latency histogram of pipeline stage.
+
+    Bucket `i` of `histogram` counts calls that took less than `2**i` microseconds
+    (and not less than `2**(i-1)`), the last bucket counts all slower calls.
+    """
+
+    calls: int = 0
+    elapsed: float = 0.0
+    histogram: list[int] = field(default_factory=lambda: [0] * HISTOGRAM_SIZE)
+
+    @property
+    def mean(self) -> float:
+        """Average call latency in seconds."""
+        return self.elapsed / self.calls if self.calls else 0.0
+
+    def record(self, elapsed: float) -> None:
+        """Add call that took `elapsed` seconds."""
+        self.calls += 1
+        self.elapsed += elapsed
+        bucket = int(elapsed * 1_000_000).bit_length()
+        self.histogram[min(bucket, HISTOGRAM_SIZE - 1)] += 1
+
+
+@dataclass(slots=True)
+class Tracer:
+    """Collects per-stage statistics of `pipe`, `compose` and `future` pipelines.
+
+    Stages are keyed by `stage_name`. Latency of async stages is time until awaited
+    result is ready.
+    """
+
+    stages: dict[str, StageStats] = field(default_factory=dict)
+
+    def record(self, func: Callable, elapsed: float) -> None:
+        """Add call of `func` that took `elapsed` seconds."""
+        name = stage_name(func)
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats()
+
+        stats.record(elapsed)
+
+    def call(self, func: Callable[..., V], *args: Any) -> V:
+        """Call sync stage and record its latency."""
+        start = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.record(func, perf_counter() - start)
+
+    async def call_async(self, func: Callable[..., Awaitable[V]], *args: Any) -> V:
+        """Call async stage, await it and record its latency."""
+        start = perf_counter()
+        try:
+            return await func(*args)
+        finally:
+            self.record(func, perf_counter() - start)
+
+    def snapshot(self) -> dict[str, StageStats]:
+        """Copy of collected statistics.
+
+        Returns:
+            dict[str, StageStats]: statistics by stage name.
+        """
+        return copy.deepcopy(self.stages)
+
+    def reset(self) -> None:
+        """Drop collected statistics."""
+        self.stages.clear()
+
+
+@dataclass(slots=True, frozen=True)
+class BlockingReport:
+    """Sync stage that held event loop longer than allowed."""
+
+    stage: str
+    pipeline: tuple[str, ...]
+    elapsed: float
+
+
+def _log_blocking(report: BlockingReport) -> None:
+    logger.warning(
+        "Stage %s blocked event loop for %.3fs in pipeline %s",
+        report.stage,
+        report.elapsed,
+        " -> ".join(report.pipeline),
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class BlockingDetector:
+    """Reports sync stages of `future` pipelines that run longer than `threshold`."""
+
+    threshold: float
+    report: Callable[[BlockingReport], None] = _log_blocking
+
+
+current: Tracer | None = None
+blocking: BlockingDetector | None = None
+
+
+def run_stage(func: Callable[..., V], args: tuple, pipeline: Sequence[Callable]) -> V:
+    """Run sync stage of `future` pipeline with active tracer and blocking detector.
+
+    Args:
+        func (Callable[..., V]): stage to run.
+        args (tuple): stage arguments.
+        pipeline (Sequence[Callable]): stages of pipeline `func` belongs to.
+
+    Returns:
+        V: stage result.
+    """
+    start = perf_counter()
+    try:
+        return func(*args)
+    finally:
+        elapsed = perf_counter() - start
+        if current is not None:
+            current.record(func, elapsed)
+        if blocking is not None and elapsed > blocking.threshold:
+            names = tuple(stage_name(stage) for stage in pipeline)
+            blocking.report(BlockingReport(stage_name(func), names, elapsed))
+
+
+async def await_stage(func: Callable[..., Awaitable[V]], args: tuple) -> V:
+    """Await async stage of `future` pipeline with active tracer.
+
+    Args:
+        func (Callable[..., Awaitable[V]]): stage to run.
+        args (tuple): stage arguments.
+
+    Returns:
+        V: stage result.
+    """
+    if current is None:
+        return await func(*args)
+
+    return await current.call_async(func, *args)
+
+
+def enable(tracer: Tracer | None = None) -> Tracer:
+    """Start tracing pipelines stages with `tracer` or a new one.
+
+    Example::
+
+            tracer = tracing.enable()
+            handle_request(request)
+            tracer.snapshot()  # {"parse_body": StageStats(calls=1, ...), ...}
+
+    Returns:
+        Tracer: active tracer.
+    """
+    global current
+    current = tracer if tracer is not None else Tracer()
+    return current
+
+
+def disable() -> None:
+    """Stop tracing pipelines stages."""
+    global current
+    current = None
+
+
+def enable_blocking_detection(
+    threshold: float = 0.1, report: Callable[[BlockingReport], None] | None = None
+) -> BlockingDetector:
+    """Start reporting sync stages of `future` pipelines that block event loop.
+
+    Sync stages passed with `<<` to `future` or to `compose` with async stages run on
+    event loop thread. Those that take more than `threshold` seconds are passed to
+    `report`, by default logged as warnings to `fundom` logger.
+
+    Example::
+
+            tracing.enable_blocking_detection(0.05, report=reports.append)
+
+    Args:
+        threshold (float): max allowed stage duration in seconds.
+        report (Callable[[BlockingReport], None] | None): blocking stages handler.
+
+    Returns:
+        BlockingDetector: active detector.
+    """
+    global blocking
+    blocking = BlockingDetector(threshold, report or _log_blocking)
+    return blocking
+
+
+def disable_blocking_detection() -> None:
+    """Stop reporting sync stages that block event loop."""
+    global blocking
+    blocking = None
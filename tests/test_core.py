@@ -1,16 +1,42 @@
+import asyncio
 import inspect
+import itertools
+import operator
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
+from fundom import core
 from fundom.core import (
+    cfilter_future,
+    cmap_future,
+    cmap_parallel,
     compose,
+    fold_assoc,
+    foldl,
+    foldr,
+    foldr_lazy,
     future,
+    hof1,
+    hof2,
+    hof3,
+    hofn,
+    in_process,
+    in_thread,
     pipe,
+    railway_compose,
+    railway_handler,
+    railway_pipe,
+    reduced,
     returns,
     returns_future,
     this,
     this_future,
+    with_batch,
 )
+from fundom.maybe import if_none, if_none_returns, if_some
+from fundom.result import if_error, if_error_returns, if_ok, safe
 
 
 @pytest.mark.parametrize(
@@ -29,6 +55,78 @@ def test_compose_sync_only(funcs, arg, result):
     assert c(arg) == result
 
 
+@pytest.mark.parametrize(
+    "funcs, arg, result",
+    [
+        ([(lambda x: x + 1)], 3, 4),
+        ([(lambda x: x + 1), (lambda x: x**2)], 3, 16),
+        ([(lambda x: x + 1)] * 300, 0, 300),
+    ],
+)
+def test_compose_compile(funcs, arg, result):
+    c = compose()
+    for func in funcs:
+        c = c << func
+
+    assert c.compile()(arg) == result
+
+
+def test_compose_compile_empty():
+    with pytest.raises(Exception):
+        compose().compile()
+
+
+def test_compose_compile_snapshot():
+    c = compose() << (lambda x: x + 1)
+    compiled = c.compile()
+    c = c << (lambda x: x * 10)
+
+    assert compiled(1) == 2
+
+
+def test_compose_map_batch():
+    calls = []
+
+    @with_batch(lambda batch: calls.append(len(batch)) or [x * 2 for x in batch])
+    def double(x: int) -> int:
+        return x * 2
+
+    c = compose() << (lambda x: x + 1) << double << (lambda x: x - 1)
+
+    assert c.map_batch(range(5)) == [c(x) for x in range(5)]
+    assert calls == [5]
+
+
+def test_compose_map_batch_wrapped_stage():
+    def inv(x: float) -> float:
+        return 1 / x
+
+    batched_inv = with_batch(lambda batch: [1 / x for x in batch])(inv)
+    c = compose() << safe(batched_inv)
+    result = c.map_batch([1, 0])
+
+    assert result[0] == 1
+    assert isinstance(result[1], ZeroDivisionError)
+    assert not hasattr(inv, "__batch__")
+
+
+def test_compose_map_batch_builtin():
+    c = compose() << with_batch(lambda batch: [len(batch)] * len(batch))(abs)
+
+    assert c(-2) == 2
+    assert c.map_batch([-1, -2]) == [2, 2]
+
+
+def test_with_batch_keeps_metadata():
+    @with_batch(lambda batch: batch)
+    def identity(x: int) -> int:
+        """Docs."""
+        return x
+
+    assert identity.__name__ == "identity"
+    assert identity.__doc__ == "Docs."
+
+
 async def add_1(x: int) -> int:
     return x + 1
 
@@ -71,6 +169,23 @@ async def test_compose_sync_async():
     assert await f(3) is False
 
 
+@pytest.mark.asyncio
+async def test_compose_async_sync_async():
+    f = compose() >> add_1 << (lambda x: x * 10) << (lambda x: x - 1) >> power_2
+    fv = f(1)
+
+    assert isinstance(fv, future)
+    assert await fv == 361
+    assert await f(0) == 81
+
+
+@pytest.mark.asyncio
+async def test_compose_future_multiple_args():
+    f = compose() << (lambda x, y: x + y) >> add_1
+
+    assert await f(1, 2) == 4
+
+
 async def async_identity(x):
     return x
 
@@ -101,6 +216,18 @@ async def test_future_lshift():
     assert await fv == 4
 
 
+@pytest.mark.asyncio
+async def test_future_lshift_fuses_sync_stages():
+    value = async_identity(3)
+    fv = future(value)
+    for _ in range(10):
+        fv = fv << (lambda x: x + 1)
+
+    assert fv.value is value
+    assert len(fv.stages) == 10
+    assert await (fv >> add_1 << (lambda x: x * 2)) == 28
+
+
 @pytest.mark.asyncio
 async def test_future_rshift():
     fv = future(async_identity(3)) >> add_1
@@ -129,6 +256,18 @@ def test_pipe_finish():
     assert pl.finish() == 6
 
 
+@pytest.mark.parametrize(
+    "funcs, arg, result",
+    [
+        ([], 3, 3),
+        ([(lambda x: x + 1)], 3, 4),
+        ([(lambda x: x + 1), (lambda x: x**2)], 3, 16),
+    ],
+)
+def test_pipe_run(funcs, arg, result):
+    assert pipe.run(arg, *funcs) == result
+
+
 def test_pipe_returns():
     f = pipe.returns(lambda x: pipe(x) >> (lambda x: x + 3))
     assert f(3) == 6
@@ -167,3 +306,275 @@ async def test_returns_future(arg):
         assert inspect.isawaitable(fv)
         assert isinstance(fv, future)
         assert await fv == arg
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+@pytest.mark.parametrize("chunksize", [None, 1, 7])
+def test_cmap_parallel(executor, chunksize):
+    f = cmap_parallel(abs, workers=2, chunksize=chunksize, executor=executor)
+
+    assert f(range(-50, 50)) == [abs(x) for x in range(-50, 50)]
+
+
+def test_cmap_parallel_unordered():
+    f = cmap_parallel(abs, workers=2, executor="thread", ordered=False)
+
+    assert sorted(f(range(-50, 50))) == sorted(abs(x) for x in range(-50, 50))
+
+
+def test_cmap_parallel_reuses_pool():
+    def thread_name(_: int) -> str:
+        return threading.current_thread().name
+
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="given") as pool:
+        f = cmap_parallel(thread_name, executor=pool)
+        assert all(name.startswith("given") for name in f(range(10)))
+        assert all(name.startswith("given") for name in f(range(10)))
+
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="shared") as pool:
+        core.set_executor("thread", pool)
+        try:
+            names = cmap_parallel(thread_name, executor="thread")(range(10))
+        finally:
+            core.set_executor("thread", None)
+
+    assert all(name.startswith("shared") for name in names)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [None, 1, 3])
+async def test_cmap_future(limit):
+    running = 0
+    peak = 0
+
+    async def slow_add_1(x: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (x % 3))
+        running -= 1
+        return x + 1
+
+    fv = pipe(range(10)) >> cmap_future(slow_add_1, limit=limit)
+
+    assert isinstance(fv, future)
+    assert await fv == list(range(1, 11))
+    assert peak <= (limit or 10)
+
+
+@pytest.mark.asyncio
+async def test_cmap_future_unordered():
+    result = [x async for x in cmap_future(add_1, limit=2, ordered=False)(range(10))]
+
+    assert sorted(result) == list(range(1, 11))
+
+
+@pytest.mark.asyncio
+async def test_cmap_future_infinite():
+    results = []
+    async for x in cmap_future(add_1, limit=3, ordered=False)(itertools.count()):
+        results.append(x)
+        if len(results) == 5:
+            break
+
+    assert len(results) == 5
+
+
+@pytest.mark.asyncio
+async def test_cmap_future_error():
+    async def fail_on_3(x: int) -> int:
+        if x == 3:
+            raise ValueError(x)
+        return x
+
+    with pytest.raises(ValueError):
+        await cmap_future(fail_on_3, limit=2)(range(10))
+
+
+@pytest.mark.asyncio
+async def test_cfilter_future():
+    assert await cfilter_future(more_then_3, limit=2)(range(8)) == [4, 5, 6, 7]
+
+    result = [x async for x in cfilter_future(more_then_3, ordered=False)(range(8))]
+    assert sorted(result) == [4, 5, 6, 7]
+
+
+@pytest.mark.parametrize(
+    "lst",
+    [[1, 2, 3, 4], (1, 2, 3, 4), range(1, 5), iter([1, 2, 3, 4]), {1, 2, 3, 4}],
+)
+def test_foldr(lst, monkeypatch):
+    monkeypatch.setattr(core, "_SPILL_CHUNK_SIZE", 3)
+
+    assert foldr(lambda x, acc: acc + [x], [])(lst) == [4, 3, 2, 1]
+
+
+def test_foldr_generator():
+    assert foldr(lambda x, acc: f"({x} {acc})", "")(x for x in "abc") == "(a (b (c )))"
+
+
+def test_foldr_lazy():
+    assert foldr_lazy(lambda x, rest: x > 3 or rest(), False)(itertools.count())
+    assert foldr_lazy(lambda x, rest: [x] + rest(), [])([1, 2, 3]) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+@pytest.mark.parametrize("chunksize", [None, 1, 7])
+def test_fold_assoc(executor, chunksize):
+    f = fold_assoc(operator.add, 0, workers=2, chunksize=chunksize, executor=executor)
+
+    assert f(range(100)) == sum(range(100))
+    assert f([]) == 0
+
+    f = fold_assoc(operator.concat, "", workers=2, executor=executor)
+    assert f("abcdefgh") == "abcdefgh"
+
+
+def test_fold_assoc_reuses_pool():
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        f = fold_assoc(operator.add, 0, chunksize=3, executor=pool)
+
+        assert f(range(100)) == sum(range(100))
+        assert f(range(10)) == sum(range(10))
+
+
+def test_foldl_reduced():
+    def sum_until_3(acc: int, x: int) -> int | reduced[int]:
+        return reduced(acc) if x > 3 else acc + x
+
+    assert foldl(sum_until_3, 0)(itertools.count(1)) == 6
+    assert foldl(sum_until_3, 0)([1, 2]) == 3
+    assert foldl(lambda acc, x: reduced(acc + x), 0)([]) == 0
+
+
+def test_foldr_reduced():
+    assert foldr(lambda x, acc: reduced(x) if x < 3 else acc + x, 0)(range(6)) == 2
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 5])
+def test_hofn(count):
+    @hofn(count)
+    def collect(*args, **kwargs):
+        return args, kwargs
+
+    assert collect.__name__ == "collect"
+    assert collect(*range(count))(-1, key="value") == (
+        (*range(count), -1),
+        {"key": "value"},
+    )
+    with pytest.raises(TypeError):
+        collect(*range(count + 1))
+
+
+def test_hof():
+    def collect(*args):
+        return args
+
+    assert hof1(collect)(1)(2) == (1, 2)
+    assert hof2(collect)(1, 2)(3) == (1, 2, 3)
+    assert hof3(collect)(1, 2, 3)(4) == (1, 2, 3, 4)
+
+
+@pytest.mark.asyncio
+async def test_in_thread():
+    main_thread = threading.get_ident()
+
+    fv = pipe(3) >> in_thread(lambda x: (x + 1, threading.get_ident()))
+
+    assert isinstance(fv, future)
+    result, thread = await fv
+    assert result == 4
+    assert thread != main_thread
+
+
+@pytest.mark.asyncio
+async def test_in_process():
+    assert await (compose() << abs >> in_process(operator.neg) << abs)(-3) == 3
+
+
+@pytest.mark.asyncio
+async def test_set_executor():
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="custom") as pool:
+        core.set_executor("thread", pool)
+        try:
+            name = await in_thread(lambda: threading.current_thread().name)()
+        finally:
+            core.set_executor("thread", None)
+
+    assert name.startswith("custom")
+
+
+def test_railway_pipe():
+    calls = []
+
+    def tracked(x):
+        calls.append(x)
+        return x
+
+    result = (
+        railway_pipe({"body": b"hello"})
+        << safe(lambda dct: dct["missing"])
+        << if_ok(tracked)
+        << tracked
+        << if_error_returns("fallback")
+        << if_error(tracked)
+        << (lambda x: x.upper())
+    ).finish()
+
+    assert result == "FALLBACK"
+    assert calls == []
+
+    result = (
+        railway_pipe({"body": b"hello"})
+        << (lambda dct: dct.get("missing"))
+        << if_some(tracked)
+        << if_error_returns("error")
+        << if_none_returns("none")
+    ).finish()
+
+    assert result == "none"
+    assert calls == []
+
+
+def test_railway_compose():
+    calls = []
+
+    def tracked(x):
+        calls.append(x)
+        return x
+
+    @railway_handler("error")
+    def on_error(err):
+        return str(err)
+
+    f = (
+        railway_compose()
+        << (lambda x: x if x > 0 else ValueError("negative"))
+        << tracked
+        << if_ok(lambda x: x * 2)
+        << on_error
+        << if_none(lambda _: "none")
+    )
+
+    assert f(3) == 6
+    assert calls == [3]
+    assert f(-1) == "negative"
+    assert calls == [3]
+
+
+def test_railway_handler_wraps():
+    @railway_handler("".join(["err", "or"]))
+    def on_error(err: Exception) -> str:
+        """Docs."""
+        return str(err)
+
+    assert on_error.__name__ == "on_error"
+    assert on_error.__doc__ == "Docs."
+    assert (railway_pipe(ValueError("bad")) << on_error).finish() == "bad"
+    assert (railway_pipe(None) << railway_handler("none")(str)).finish() == "None"
+    assert not hasattr(str, "track")
+
+    err = ValueError("bad")
+    wrapped = safe(on_error)
+    assert (railway_pipe(err) << wrapped).finish() is err
+    assert (railway_pipe(1) << wrapped).finish() == "1"
@@ -74,6 +74,24 @@ def test_choose_some(value, funcs, result):
     assert c(value) == result
 
 
+@pytest.mark.parametrize(
+    "isolation_mode, result",
+    [
+        ("deepcopy", [1]),
+        ("copy", [1]),
+        ("none", None),
+    ],
+)
+def test_choose_some_isolation(isolation_mode, result):
+    c = (
+        choose_some(isolation_mode)
+        | (lambda dct: dct.pop("key") and None)
+        | (lambda dct: dct.get("key"))
+    )
+
+    assert c({"key": [1]}) == result
+
+
 def test_choose_some_returns_none_on_empty():
     c = choose_some()
     assert c(1) is None
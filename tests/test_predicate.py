@@ -1,6 +1,23 @@
+import asyncio
+from dataclasses import dataclass
+from functools import wraps
+
 import pytest
 
-from fundom.predicate import each, one
+from fundom.predicate import (
+    each,
+    is_empty,
+    is_not_empty,
+    len_less_or_equals,
+    len_less_then,
+    len_more_or_equals,
+    len_more_then,
+    mask,
+    one,
+    rule_set,
+    vectorized,
+)
+from fundom.result import safe
 
 
 @pytest.mark.parametrize(
@@ -99,3 +116,238 @@ def test_one_returns_false():
 def test_each_returns_true():
     e = each()
     assert e(1) is True
+
+
+@pytest.mark.asyncio
+async def test_each_and_one_concurrent():
+    cancelled = []
+
+    async def never(x: int) -> bool:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+        return True
+
+    e = each(concurrent=True) << (lambda x: x > 0) >> never >> less_than_10
+    o = one(concurrent=True) << (lambda x: x < 0) >> never >> more_than_3
+
+    assert await e(20) is False
+    assert await o(5) is True
+    await asyncio.sleep(0)
+    assert cancelled == [20, 5]
+
+    assert await (each(concurrent=True) >> more_than_3 >> less_than_10)(5) is True
+    assert await (one(concurrent=True) >> more_than_3 >> less_than_10)(20) is True
+    assert await (one(concurrent=True) >> more_than_3)(1) is False
+
+
+@pytest.mark.parametrize(
+    "combinator, stop_on",
+    [(each, False), (one, True)],
+)
+def test_adaptive_reorders_predicates(combinator, stop_on):
+    def expensive(x: int) -> bool:
+        sum(range(1_000))
+        return x % 2 == 0
+
+    def cheap(x: int) -> bool:
+        return stop_on
+
+    p = combinator(adaptive=True) << expensive << cheap
+
+    assert [stat.predicate for stat in p.stats] == [expensive, cheap]
+    for x in range(1_024):
+        assert p(x) is stop_on
+
+    assert [stat.predicate for stat in p.stats] == [cheap, expensive]
+    assert p.stats[1].calls == 256
+    assert combinator().stats == []
+
+
+def test_adaptive_keeps_untimed_predicates():
+    def never_called(_: int) -> bool:
+        raise AssertionError
+
+    p = each(adaptive=True) << (lambda _: False) << never_called
+
+    for x in range(1_024):
+        assert p(x) is False
+
+    assert p.stats[1].predicate is never_called
+
+
+def test_len_predicates():
+    assert len_more_then(2)("abc") is True
+    assert len_more_then(3)("abc") is False
+    assert len_less_then(3)("ab") is True
+    assert len_less_then(3)("abc") is False
+    assert len_more_or_equals(3)("abc") is True
+    assert len_less_or_equals(2)("abc") is False
+
+
+def negate(predicate):
+    @wraps(predicate)
+    def _negated(x):
+        return not predicate(x)
+
+    return _negated
+
+
+def test_wrapped_len_predicates_not_merged():
+    p = each() << negate(len_more_then(3))
+
+    assert p("ab") is True
+    assert p.compile()("ab") is True
+    assert rule_set({"short": p})("ab") == ["short"]
+    assert isinstance(safe(len_more_then(3))(1), TypeError)
+    safe_p = each() << safe(len_more_then(3))
+    assert safe_p.compile()(1) is safe_p(1)
+
+
+def test_compile():
+    is_even = lambda x: len(x) % 2 == 0  # noqa: E731
+    p = (
+        each()
+        << (one() << is_even << is_empty)
+        << len_more_then(3)
+        << (each() << len_less_then(10) << is_not_empty << is_even)
+        << len_more_or_equals(2)
+    )
+    compiled = p.compile()
+
+    for size in range(15):
+        assert compiled("x" * size) == p("x" * size)
+
+    assert (each() << one()).compile()("abc") is False
+    assert (one() << each()).compile()("abc") is True
+    assert (each() << len_more_then(5) << len_less_then(3)).compile()("abcd") is False
+
+
+def test_compile_drops_duplicates():
+    calls = []
+
+    def is_short(x: str) -> bool:
+        calls.append(x)
+        return len(x) < 5
+
+    p = (each() << is_short << (each() << is_short)).compile()
+
+    assert p("abc") is True
+    assert calls == ["abc"]
+
+
+def test_rule_set():
+    calls = []
+
+    def tracked(predicate):
+        def _tracked(x):
+            calls.append(predicate)
+            return predicate(x)
+
+        return _tracked
+
+    is_positive = tracked(lambda x: x > 0)
+    is_even = tracked(lambda x: x % 2 == 0)
+    is_small = tracked(lambda x: x < 10)
+
+    rules = rule_set(
+        {
+            "positive even": each() << is_positive << is_even,
+            "small positive": each() << is_small << is_positive,
+            "even or small": one() << is_even << is_small,
+            "positive": is_positive,
+        }
+    )
+
+    assert rules(4) == ["positive even", "small positive", "even or small", "positive"]
+    assert len(calls) == 3
+
+    calls.clear()
+    assert rules(-3) == ["even or small"]
+    assert len(calls) == 3
+    assert rules(13) == ["positive"]
+
+
+def test_rule_set_unhashable_predicate():
+    @dataclass
+    class divisible_by:  # noqa
+        divisor: int
+
+        def __call__(self, x: int) -> bool:
+            return x % self.divisor == 0
+
+    by_3 = divisible_by(3)
+    rules = rule_set({"fizz": by_3, "fizzbuzz": each() << by_3 << divisible_by(5)})
+
+    assert len(rules.nodes) == 3
+    assert rules(15) == ["fizz", "fizzbuzz"]
+    assert rules(3) == ["fizz"]
+
+
+def test_mask():
+    np = pytest.importorskip("numpy")
+
+    calls = []
+
+    def has_a(x: str) -> bool:
+        calls.append(x)
+        return "a" in x
+
+    @vectorized(lambda values: np.char.startswith(values, "b"))
+    def starts_with_b(x: str) -> bool:
+        return x.startswith("b")
+
+    values = ["", "bob", "alice", "anna-maria", "ben"]
+    p = each() << is_not_empty << len_less_then(6) << (one() << has_a << starts_with_b)
+
+    expected = [p(x) for x in values]
+    calls.clear()
+
+    assert mask(p, values).tolist() == expected
+    assert calls == ["bob", "alice", "ben"]
+    assert mask(is_empty, np.array(values)).tolist() == [True] + [False] * 4
+    assert mask(lambda x: x > 1, [1, 2, 3]).tolist() == [False, True, True]
+    assert mask(len_more_then(1), [[1], [1, 2], [1, 2, 3]]).tolist() == [
+        False,
+        True,
+        True,
+    ]
+
+
+def test_mask_tuple_rows():
+    pytest.importorskip("numpy")
+
+    allowed = {(1, 2)}
+    rows = [(1, 2), (3, 4)]
+
+    assert mask(lambda row: row in allowed, rows).tolist() == [True, False]
+    assert mask(lambda row: row == (3, 4), rows).tolist() == [False, True]
+    assert mask(lambda x: x == 1, [1, "1"]).tolist() == [True, False]
+
+
+def test_vectorized_builtin():
+    np = pytest.importorskip("numpy")
+
+    is_true = vectorized(lambda values: values.astype(bool))(bool)
+
+    assert is_true(1) is True
+    assert mask(is_true, np.array([0, 1])).tolist() == [False, True]
+    assert not hasattr(bool, "mask")
+
+
+def test_mask_wrapped_len_predicate():
+    pytest.importorskip("numpy")
+
+    assert mask(each() << negate(len_more_then(3)), ["ab"]).tolist() == [True]
+
+
+def test_mask_passes_original_elements():
+    pytest.importorskip("numpy")
+
+    assert mask(lambda x: isinstance(x, int), [1, 2, 3]).tolist() == [True] * 3
+    assert mask(lambda x: type(x) is str, ["a", "bc"]).tolist() == [True, True]
+    assert mask(
+        each() << is_not_empty << (lambda x: type(x) is str), ["", "ab"]
+    ).tolist() == [False, True]
@@ -1,7 +1,10 @@
+import asyncio
 from dataclasses import dataclass
 
 import pytest
 
+from fundom import core
+from fundom.core import returns, this
 from fundom.result import (
     EmptyChooseOkError,
     FailedChooseOkError,
@@ -15,6 +18,7 @@ from fundom.result import (
     ok_when_future,
     safe,
     safe_future,
+    set_keep_tracebacks,
 )
 
 
@@ -79,6 +83,75 @@ async def test_safe_future():
     assert await test_func(20) == TestError()
 
 
+def test_safe_keep_traceback():
+    def fail():
+        try:
+            {}["key"]
+        except KeyError as err:
+            raise ValueError() from err
+
+    assert safe(fail)().__traceback__ is not None
+
+    err = safe(keep_traceback=False)(fail)()
+    assert isinstance(err, ValueError)
+    assert err.__traceback__ is None
+    assert err.__cause__.__traceback__ is None
+
+    set_keep_tracebacks(False)
+    try:
+        assert safe(fail)().__traceback__ is None
+        assert safe(keep_traceback=True)(fail)().__traceback__ is not None
+    finally:
+        set_keep_tracebacks(True)
+
+
+def test_safe_keep_traceback_of_caller_error():
+    def fail():
+        raise ValueError()
+
+    def handle():
+        try:
+            {}["key"]
+        except KeyError:
+            err = safe(keep_traceback=False)(fail)()
+            assert err.__traceback__ is None
+            assert err.__context__ is None
+            raise
+
+    with pytest.raises(KeyError) as info:
+        handle()
+
+    assert len(info.traceback) == 2
+
+
+def test_safe_errors():
+    missing = KeyError("missing")
+    get = safe(errors={KeyError: missing})(lambda dct: dct["key"])
+
+    assert get({"key": 1}) == 1
+    assert get({}) is missing
+    assert safe(errors={LookupError: missing})(lambda: [][0])() is missing
+    assert isinstance(
+        safe(errors={KeyError: missing})(lambda: 1 / 0)(), ZeroDivisionError
+    )
+
+
+@pytest.mark.asyncio
+async def test_safe_future_options():
+    missing = TestError()
+
+    @safe_future(keep_traceback=False, errors={KeyError: missing})
+    async def test_func(x: int):
+        if x > 10:
+            raise TestError()
+        return {}[x]
+
+    assert await test_func(5) is missing
+    err = await test_func(20)
+    assert isinstance(err, TestError)
+    assert err.__traceback__ is None
+
+
 @pytest.mark.parametrize(
     "replacement, value, result",
     [
@@ -141,6 +214,46 @@ def test_choose_ok_returns_error_on_failed():
     assert result.args == (6,)
 
 
+def _pop_and_fail(dct: dict) -> Exception:
+    dct.pop("key")
+    return Exception()
+
+
+@pytest.mark.parametrize(
+    "isolation_mode, result",
+    [
+        ("deepcopy", {"key": [1]}),
+        ("copy", {"key": [1]}),
+        ("none", None),
+    ],
+)
+def test_choose_ok_isolation(isolation_mode, result):
+    c = choose_ok(isolation_mode) | _pop_and_fail | (lambda dct: dct.get("key"))
+
+    assert c({"key": [1]}) == (result and result["key"])
+
+
+def test_choose_ok_isolation_immutable():
+    c = choose_ok("immutable") | (lambda x: x)
+
+    assert c((1, "a", frozenset({2}))) == (1, "a", frozenset({2}))
+    with pytest.raises(TypeError):
+        c({"key": 1})
+
+
+def test_choose_ok_isolation_immutable_checked_once(monkeypatch):
+    checks = []
+    check = core._check_immutable
+    monkeypatch.setattr(
+        core, "_check_immutable", lambda arg: checks.append(arg) or check(arg)
+    )
+    fail = returns(Exception())
+    c = choose_ok("immutable") | fail | fail | this
+
+    assert c(1) == 1
+    assert len(checks) == 1
+
+
 async def add_1(x: int) -> int:
     return x + 1
 
@@ -193,3 +306,33 @@ async def test_choose_ok_future_returns_error_on_failed():
     result = await c(6)
     assert isinstance(result, FailedChooseOkError)
     assert result.args == (6,)
+
+
+@pytest.mark.asyncio
+async def test_choose_ok_future_hedged():
+    cancelled = []
+
+    async def slow(x: int) -> int:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+        return x
+
+    c = choose_ok_future(hedge_delay=0.01) | slow | add_1 | add_2
+
+    assert await c(1) == 2
+    await asyncio.sleep(0)
+    assert cancelled == [1]
+
+
+@pytest.mark.asyncio
+async def test_choose_ok_future_hedged_all_at_once():
+    c = choose_ok_future(hedge_delay=0) | less_then_3 | add_1 | add_2
+    assert await c(6) == 7
+
+    c = choose_ok_future(hedge_delay=0) | less_then_3 | more_then_10
+    result = await c(6)
+    assert isinstance(result, FailedChooseOkError)
+    assert result.args == (6,)
@@ -0,0 +1,178 @@
+import asyncio
+import functools
+import itertools
+
+import pytest
+
+from fundom import stream as stream_module
+from fundom.stream import (
+    afilter,
+    amap,
+    astream,
+    buffer,
+    chunk,
+    flat_map,
+    sfilter,
+    smap,
+    stream,
+    take,
+)
+
+
+@pytest.mark.parametrize(
+    "stages, source, result",
+    [
+        ([], range(3), [0, 1, 2]),
+        ([(lambda x: x + 1), smap(lambda x: x * 2)], range(3), [2, 4, 6]),
+        ([sfilter(lambda x: x % 2 == 0)], range(6), [0, 2, 4]),
+        ([take(2)], range(6), [0, 1]),
+        ([take(0)], range(6), []),
+        ([flat_map(lambda x: [x] * x)], range(4), [1, 2, 2, 3, 3, 3]),
+        ([chunk(2)], range(5), [[0, 1], [2, 3], [4]]),
+        (
+            [
+                sfilter(lambda x: x % 2 == 1),
+                flat_map(lambda x: range(x)),
+                take(5),
+                chunk(2),
+                (lambda lst: sum(lst)),
+            ],
+            itertools.count(),
+            [0, 3, 0],
+        ),
+    ],
+)
+def test_stream(stages, source, result):
+    s = stream(source)
+    for stage in stages:
+        s = s << stage
+
+    assert s.finish() == result
+
+
+def test_stream_is_lazy():
+    consumed = []
+
+    def source():
+        for x in itertools.count():
+            consumed.append(x)
+            yield x
+
+    s = stream(source()) << sfilter(lambda x: x > 2) << take(2)
+
+    assert consumed == []
+    assert list(s) == [3, 4]
+    assert consumed == [0, 1, 2, 3, 4]
+
+
+def test_stream_fused_once_per_shape(monkeypatch):
+    generated = []
+    factory = stream_module._fused_factory.__wrapped__
+    monkeypatch.setattr(
+        stream_module,
+        "_fused_factory",
+        functools.lru_cache(lambda kinds: generated.append(kinds) or factory(kinds)),
+    )
+
+    for offset in range(3):
+        s = (
+            stream(range(5))
+            << (lambda x: x + offset)
+            << sfilter(lambda x: x % 2)
+            << take(1)
+        )
+        assert s.finish() == [x + offset for x in range(5) if (x + offset) % 2][:1]
+
+    assert generated == [("map", "filter", "take")]
+
+
+async def add_1(x: int) -> int:
+    await asyncio.sleep(0.001 * (x % 3))
+    return x + 1
+
+
+async def is_even(x: int) -> bool:
+    return x % 2 == 0
+
+
+async def pages():
+    for page in range(3):
+        await asyncio.sleep(0)
+        yield [page * 10, page * 10 + 1]
+
+
+@pytest.mark.asyncio
+async def test_astream():
+    s = (
+        astream(pages())
+        << flat_map(lambda page: page)
+        >> add_1
+        >> amap(add_1, limit=3)
+        << sfilter(lambda x: x > 2)
+        >> afilter(is_even, limit=2)
+        << buffer(2)
+        << chunk(3)
+    )
+
+    assert await s.finish() == [[12, 22]]
+
+
+@pytest.mark.asyncio
+async def test_astream_sync_source_and_take():
+    s = astream(itertools.count()) >> add_1 << take(3) << (lambda x: x * 2)
+
+    assert [x async for x in s] == [2, 4, 6]
+
+
+@pytest.mark.asyncio
+async def test_astream_limits_in_flight():
+    running = 0
+    peak = 0
+
+    async def slow(x: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return x
+
+    assert await (astream(range(10)) >> amap(slow, limit=3)).finish() == list(range(10))
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_astream_buffer_propagates_errors():
+    def fail(x: int) -> int:
+        raise ValueError(x)
+
+    with pytest.raises(ValueError):
+        await (astream(range(3)) << fail << buffer(1)).finish()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "stages",
+    [
+        [take(2)],
+        [amap(add_1, limit=2), take(2)],
+        [afilter(is_even, limit=2), buffer(2), take(2)],
+    ],
+)
+async def test_astream_take_closes_source(stages):
+    closed = False
+
+    async def source():
+        nonlocal closed
+        try:
+            for x in itertools.count():
+                yield x
+        finally:
+            closed = True
+
+    s = astream(source())
+    for stage in stages:
+        s = s >> stage
+
+    assert len(await s.finish()) == 2
+    assert closed
@@ -0,0 +1,117 @@
+import time
+
+import pytest
+
+from fundom import tracing
+from fundom.core import compose, future, pipe, railway_compose, railway_pipe
+from fundom.pointfree import str_split
+
+
+def add_1(x: int) -> int:
+    return x + 1
+
+
+async def double(x: int) -> int:
+    return x * 2
+
+
+@pytest.fixture
+def tracer():
+    yield tracing.enable()
+    tracing.disable()
+
+
+def test_stage_name():
+    assert tracing.stage_name(add_1) == "add_1"
+    assert tracing.stage_name(str_split(",")) == "split"
+    assert tracing.stage_name(compose()) == "compose"
+
+
+def test_pipe_and_compose_traced(tracer):
+    assert (pipe(1) << add_1 << add_1).finish() == 3
+    assert (compose() << add_1 << str)(1) == "2"
+    assert (compose() << add_1).compile()(1) == 2
+
+    stats = tracer.snapshot()
+    assert stats["add_1"].calls == 4
+    assert sum(stats["add_1"].histogram) == 4
+    assert stats["str"].calls == 1
+
+
+def test_compile_traced_snapshot(tracer):
+    c = compose() << add_1
+    compiled = c.compile()
+    c = c << add_1
+
+    assert compiled(1) == 2
+
+
+def test_compiled_before_enable_traced():
+    compiled = (compose() << add_1 << add_1).compile()
+    tracer = tracing.enable()
+    try:
+        assert compiled(1) == 3
+        assert pipe.run(1, add_1) == 2
+        assert (railway_pipe(1) << add_1).finish() == 2
+        assert (railway_compose() << add_1 << add_1)(1) == 3
+    finally:
+        tracing.disable()
+
+    assert compiled(1) == 3
+    assert tracer.snapshot()["add_1"].calls == 6
+
+
+@pytest.mark.asyncio
+async def test_future_traced(tracer):
+    assert await (pipe(1) >> double << add_1 >> double) == 6
+    assert await (compose() << add_1 >> double << add_1)(1) == 5
+    assert await (future(double(1)) << add_1) == 3
+
+    stats = tracer.snapshot()
+    assert stats["double"].calls == 3
+    assert stats["add_1"].calls == 4
+
+
+def test_tracing_disabled():
+    tracer = tracing.Tracer()
+    tracing.enable(tracer)
+    tracing.disable()
+
+    assert (pipe(1) << add_1).finish() == 2
+    assert tracer.snapshot() == {}
+
+
+def slow_parse(x: int) -> int:
+    time.sleep(0.02)
+    return x
+
+
+@pytest.fixture
+def reports():
+    reports = []
+    tracing.enable_blocking_detection(0.01, report=reports.append)
+    yield reports
+    tracing.disable_blocking_detection()
+
+
+@pytest.mark.asyncio
+async def test_blocking_detection(reports):
+    assert await (future(double(1)) << add_1 << slow_parse) == 3
+    assert await (compose() >> double << slow_parse << add_1)(1) == 3
+
+    assert [(report.stage, report.pipeline) for report in reports] == [
+        ("slow_parse", ("add_1", "slow_parse")),
+        ("slow_parse", ("double", "slow_parse", "add_1")),
+    ]
+    assert all(report.elapsed >= 0.01 for report in reports)
+
+
+@pytest.mark.asyncio
+async def test_blocking_detection_logs(caplog):
+    tracing.enable_blocking_detection(0.01)
+    try:
+        await (future(double(1)) << slow_parse)
+    finally:
+        tracing.disable_blocking_detection()
+
+    assert "slow_parse blocked event loop" in caplog.text